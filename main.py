@@ -33,10 +33,7 @@ def main():
     try:
         if args.mode == 'tray':
             # Run in system tray mode (default)
-            try:
-                from src.gui_components.tray_app_fixed import TrayApplication
-            except ImportError:
-                from src.gui_components.tray_app import TrayApplication
+            from src.gui_components.tray_app import TrayApplication
             app = TrayApplication()
             app.run()
             
@@ -3,7 +3,7 @@ import os
 import time
 import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import logging
 
 # Windows service imports
@@ -27,10 +27,15 @@ from src.utils.statistics import StatisticsTracker
 class ServiceManager:
     """Main service manager with error recovery and monitoring"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None,
+                 ui_callback: Optional[Callable[..., None]] = None):
         self.config = Config(config_path)
         self.logger = get_logger("ServiceManager")
         
+        # Receives ("log", msg), ("stat", key, value) and ("status", state)
+        # messages; called from service threads, so it must not touch widgets
+        self.ui_callback = ui_callback
+        
         # Service state
         self.running = False
         self.paused = False
@@ -107,10 +112,13 @@ class ServiceManager:
             self.main_thread.start()
             
             self.logger.info("Service started successfully")
+            self._notify_ui("status", "Running")
             
         except Exception as e:
             self.running = False
             log_exception(e, "Service start")
+            self._notify_ui("log", f"Error starting service: {e}")
+            self._notify_ui("status", "Error")
             raise ServiceError(f"Failed to start service: {e}")
     
     def stop(self):
@@ -140,6 +148,15 @@ class ServiceManager:
             self.logger.info(f"Service statistics: {stats}")
         
         self.logger.info("Service stopped")
+        self._notify_ui("status", "Stopped")
+    
+    def _notify_ui(self, kind: str, *payload):
+        """Send a message to the UI callback, if one is registered"""
+        if self.ui_callback:
+            try:
+                self.ui_callback(kind, *payload)
+            except Exception as e:
+                self.logger.debug(f"UI callback error: {e}")
     
     def _cleanup_components(self):
         """Clean up all service components"""
@@ -162,11 +179,13 @@ class ServiceManager:
         """Pause the service"""
         self.paused = True
         self.logger.info("Service paused")
+        self._notify_ui("status", "Paused")
     
     def resume(self):
         """Resume the service"""
         self.paused = False
         self.logger.info("Service resumed")
+        self._notify_ui("status", "Running")
     
     def _main_loop(self):
         """Main service loop with error recovery"""
@@ -184,11 +203,13 @@ class ServiceManager:
                 # Check time limit
                 if datetime.now() >= self.end_time:
                     self.logger.info("Session time limit reached")
+                    self._notify_ui("log", "Session time limit reached")
                     break
                 
                 # Check question limit
                 if questions_answered >= max_questions:
                     self.logger.info(f"Maximum questions answered ({max_questions})")
+                    self._notify_ui("log", f"Maximum questions answered ({max_questions})")
                     break
                 
                 # Capture screen
@@ -206,6 +227,8 @@ class ServiceManager:
                     
                     # Track detection
                     self._stats_tracker.track_detection(detection)
+                    self._notify_ui("log", f"Question detected: {detection.question_text[:50]}...")
+                    self._notify_ui("stat", "questions_detected", self._stats_tracker.questions_detected)
                     
                     # Research answer
                     answer = self._researcher.research_answer(
@@ -227,6 +250,10 @@ class ServiceManager:
                             questions_answered += 1
                             self._stats_tracker.track_answer(answer, success)
                             
+                            stats = self._stats_tracker.get_current_stats()
+                            self._notify_ui("stat", "questions_answered", stats['questions_answered'])
+                            self._notify_ui("stat", "success_rate", stats['success_rate'])
+                            
                             # Pace actions
                             self._pace_actions(questions_answered, max_questions)
                     else:
@@ -242,6 +269,7 @@ class ServiceManager:
                 self._handle_error(e)
                 if self.error_count >= self.max_errors:
                     self.logger.error("Maximum errors reached, stopping service")
+                    self._notify_ui("log", "Maximum errors reached, stopping service")
                     break
     
     def _pace_actions(self, current_questions: int, max_questions: int):
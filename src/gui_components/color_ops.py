@@ -0,0 +1,31 @@
+"""Vectorized color helpers for the ultra-modern widgets"""
+from functools import lru_cache
+import numpy as np
+
+# Brightness is scaled in linear light, approximating sRGB with a 2.2 gamma
+_GAMMA = 2.2
+
+
+@lru_cache(maxsize=1024)
+def hex_to_rgb(hex_color: str) -> tuple:
+    """Convert hex to RGB"""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=1024)
+def adjust_brightness(hex_color: str, factor: float) -> str:
+    """Adjust color brightness"""
+    rgb = [
+        min(1.0, (x / 255.0) ** _GAMMA * factor) ** (1 / _GAMMA)
+        for x in hex_to_rgb(hex_color)
+    ]
+    return '#{:02x}{:02x}{:02x}'.format(*[int(x*255) for x in rgb])
+
+
+def lerp_rgb(c1: np.ndarray, c2: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Interpolate between two RGB colors for each ratio in t (Nx3 uint8)"""
+    c1 = np.asarray(c1, dtype=np.float64)
+    c2 = np.asarray(c2, dtype=np.float64)
+    return (c1 + (c2 - c1) * t[:, None]).astype(np.uint8)
+
@@ -374,82 +374,107 @@ class ToggleSwitch(Canvas):
         self._draw_switch()
 
 class NotificationToast(tk.Toplevel):
-    """Toast notification popup"""
+    """Toast notification popup; persistent toasts hide on timeout and can be re-shown"""
     
-    def __init__(self, parent, message: str, toast_type: str = "info", 
-                 duration: int = 3000):
+    TYPE_COLORS = {
+        "info": "accent",
+        "success": "success",
+        "warning": "warning",
+        "error": "error"
+    }
+    
+    TYPE_ICONS = {
+        "info": "ℹ",
+        "success": "✓",
+        "warning": "⚠",
+        "error": "✕"
+    }
+    
+    def __init__(self, parent, message: str = "", toast_type: str = "info", 
+                 duration: int = 3000, persistent: bool = False):
         super().__init__(parent)
         
-        theme = theme_manager.get_theme()
+        self.parent = parent
+        self.persistent = persistent
+        self._close_after = None
+        self._fade_after = None
         
         # Window setup
         self.overrideredirect(True)
         self.attributes("-topmost", True)
         self.attributes("-alpha", 0.9)
         
-        # Style based on type
-        colors = {
-            "info": theme["accent"],
-            "success": theme["success"],
-            "warning": theme["warning"],
-            "error": theme["error"]
-        }
-        
-        bg_color = colors.get(toast_type, theme["accent"])
-        
         # Frame
-        frame = tk.Frame(self, bg=bg_color, padx=15, pady=10)
-        frame.pack()
+        self._frame = tk.Frame(self, padx=15, pady=10)
+        self._frame.pack()
         
         # Icon
-        icons = {
-            "info": "ℹ",
-            "success": "✓",
-            "warning": "⚠",
-            "error": "✕"
-        }
-        
-        icon_label = tk.Label(
-            frame,
-            text=icons.get(toast_type, "ℹ"),
+        self._icon_label = tk.Label(
+            self._frame,
             font=("Segoe UI", 14),
-            bg=bg_color,
             fg="white"
         )
-        icon_label.pack(side="left", padx=(0, 10))
+        self._icon_label.pack(side="left", padx=(0, 10))
         
         # Message
-        msg_label = tk.Label(
-            frame,
-            text=message,
+        self._msg_label = tk.Label(
+            self._frame,
             font=theme_manager.get_font("body"),
-            bg=bg_color,
             fg="white"
         )
-        msg_label.pack(side="left")
+        self._msg_label.pack(side="left")
+        
+        if persistent and not message:
+            self.withdraw()
+        else:
+            self.show(message, toast_type, duration)
+    
+    def show(self, message: str, toast_type: str = "info", duration: int = 3000):
+        """Display a message, restarting the close timer"""
+        theme = theme_manager.get_theme()
+        
+        # Style based on type
+        bg_color = theme[self.TYPE_COLORS.get(toast_type, "accent")]
+        self._frame.configure(bg=bg_color)
+        self._icon_label.configure(text=self.TYPE_ICONS.get(toast_type, "ℹ"), bg=bg_color)
+        self._msg_label.configure(text=message, bg=bg_color)
         
         # Position
         self.update_idletasks()
-        x = parent.winfo_x() + parent.winfo_width() - self.winfo_width() - 20
+        parent = self.parent
+        x = parent.winfo_x() + parent.winfo_width() - self.winfo_reqwidth() - 20
         y = parent.winfo_y() + 50
         self.geometry(f"+{x}+{y}")
+        self.deiconify()
         
         # Auto close
-        self.after(duration, self.destroy)
+        if self._close_after:
+            self.after_cancel(self._close_after)
+        self._close_after = self.after(duration, self.hide if self.persistent else self.destroy)
         
         # Fade in animation
         self._fade_in()
     
+    def hide(self):
+        """Hide a persistent toast until the next show()"""
+        if self._close_after:
+            self.after_cancel(self._close_after)
+            self._close_after = None
+        self.withdraw()
+    
     def _fade_in(self):
         """Fade in animation"""
+        if self._fade_after:
+            self.after_cancel(self._fade_after)
         alpha = 0
         
         def fade():
             nonlocal alpha
+            self._fade_after = None
             if alpha < 0.9:
                 alpha += 0.1
                 self.attributes("-alpha", alpha)
-                self.after(20, fade)
+                self._fade_after = self.after(20, fade)
         
         fade()
 
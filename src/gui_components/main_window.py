@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sys
+import os
 from pathlib import Path
 import threading
+import concurrent.futures
+import collections
+import time
 import json
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from src.core.config import Config
 from src.core.service_manager import ServiceManager
 from src.utils.logger import get_logger
@@ -14,6 +16,19 @@ from src.utils.logger import get_logger
 class EnhancedGUI:
     """Enhanced GUI with tabs and advanced features"""
     
+    # Config keys edited through the GUI
+    CONFIG_KEYS = (
+        'context', 'duration_minutes', 'num_questions', 'question_type',
+        'api_key', 'monitoring_interval', 'confidence_threshold', 'tesseract_path',
+        'performance.enable_caching', 'performance.parallel_processing',
+        'ocr_preprocessing'
+    )
+    
+    # Log viewer loads the tail first, then streams older content in chunks
+    LOG_TAIL_BYTES = 65536
+    LOG_CHUNK_BYTES = 32768
+    LOG_MAX_LINES = 5000
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Question Assistant Pro")
@@ -22,6 +37,19 @@ class EnhancedGUI:
         
         self.config = Config()
         self.service_manager = None
+        self._cfg_snapshot = {}
+        self._log_stream_id = 0
+        self._log_cache = (None, None)  # (dir_mtime, latest_path)
+        self._log_sig = None  # (path, size, mtime) of the log currently shown
+        self._log_ring = collections.deque(maxlen=self.LOG_MAX_LINES)
+        self._log_render_pending = False
+        self._log_render_hash = None
+        self._autoscroll_pending = False
+        self.autoscroll = True
+        self._last_stats_refresh = 0.0
+        self._stats_max_hz = 4
+        self._hist_rows = {}
+        self._svc_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="svc")
         self.logger = get_logger("GUI")
         
         # Set theme
@@ -100,25 +128,37 @@ class EnhancedGUI:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Configuration tab
         self.config_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.config_frame, text="Configuration")
-        self.create_config_tab()
-        
-        # Advanced tab
         self.advanced_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.advanced_frame, text="Advanced")
-        self.create_advanced_tab()
-        
-        # Statistics tab
         self.stats_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.stats_frame, text="Statistics")
-        self.create_stats_tab()
-        
-        # Logs tab
         self.logs_frame = ttk.Frame(self.notebook)
+        
+        self.notebook.add(self.config_frame, text="Configuration")
+        self.notebook.add(self.advanced_frame, text="Advanced")
+        self.notebook.add(self.stats_frame, text="Statistics")
         self.notebook.add(self.logs_frame, text="Logs")
-        self.create_logs_tab()
+        
+        # Tab contents are built on first selection
+        self._tab_builders = {
+            str(self.config_frame): self.create_config_tab,
+            str(self.advanced_frame): self.create_advanced_tab,
+            str(self.stats_frame): self.create_stats_tab,
+            str(self.logs_frame): self.create_logs_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+        # Build the initially selected tab right away
+        self._build_tab(self.notebook.select())
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab the first time it is shown"""
+        self._build_tab(self.notebook.select())
+    
+    def _build_tab(self, frame):
+        """Run the builder for a tab frame if it has not been built yet"""
+        builder = self._tab_builders.pop(str(frame), None)
+        if builder:
+            builder()
     
     def create_config_tab(self):
         """Create configuration tab"""
@@ -165,14 +205,13 @@ class EnhancedGUI:
         
         # API Key
         ttk.Label(api_frame, text="API Key:").grid(row=1, column=0, sticky='w', pady=5)
-        self.api_key_var = tk.StringVar()
-        api_entry = ttk.Entry(api_frame, textvariable=self.api_key_var, show='*', width=40)
-        api_entry.grid(row=1, column=1, sticky='w', pady=5)
+        self._api_entry = ttk.Entry(api_frame, show='*', width=40)
+        self._api_entry.grid(row=1, column=1, sticky='w', pady=5)
         
         # Show/Hide key button
         self.show_key_var = tk.BooleanVar(value=False)
         show_btn = ttk.Checkbutton(api_frame, text="Show", variable=self.show_key_var,
-                                  command=lambda: api_entry.config(show='' if self.show_key_var.get() else '*'))
+                                  command=lambda: self._api_entry.config(show='' if self.show_key_var.get() else '*'))
         show_btn.grid(row=1, column=2, padx=5)
         
         # Control buttons
@@ -200,10 +239,13 @@ class EnhancedGUI:
         ttk.Spinbox(perf_frame, from_=1, to=30, textvariable=self.interval_var, width=10).grid(row=0, column=1, sticky='w')
         
         ttk.Label(perf_frame, text="Confidence Threshold:").grid(row=1, column=0, sticky='w', pady=5)
-        self.confidence_var = tk.DoubleVar(value=0.5)
-        ttk.Scale(perf_frame, from_=0.1, to=1.0, variable=self.confidence_var, 
-                 orient='horizontal', length=200).grid(row=1, column=1, sticky='w')
-        ttk.Label(perf_frame, textvariable=self.confidence_var).grid(row=1, column=2)
+        # Stored as a whole percentage so the label never shows long floats
+        self._conf_pct = tk.IntVar(value=50)
+        ttk.Scale(perf_frame, from_=10, to=100, variable=self._conf_pct, 
+                 orient='horizontal', length=200,
+                 command=self._update_confidence_label).grid(row=1, column=1, sticky='w')
+        self._conf_label = ttk.Label(perf_frame, text="0.50", width=4)
+        self._conf_label.grid(row=1, column=2)
         
         self.cache_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(perf_frame, text="Enable Caching", variable=self.cache_var).grid(row=2, column=0, sticky='w', pady=5)
@@ -281,12 +323,15 @@ class EnhancedGUI:
     def create_logs_tab(self):
         """Create logs tab"""
         # Log viewer
-        self.log_text = tk.Text(self.logs_frame, height=20, width=80, wrap='word')
-        self.log_text.pack(fill='both', expand=True, padx=10, pady=10)
+        text_frame = ttk.Frame(self.logs_frame)
+        text_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        self.log_text = tk.Text(text_frame, height=20, width=80, wrap='word')
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(self.log_text, orient='vertical', command=self.log_text.yview)
+        scrollbar = ttk.Scrollbar(text_frame, orient='vertical', command=self.log_text.yview)
         scrollbar.pack(side='right', fill='y')
+        self.log_text.pack(side='left', fill='both', expand=True)
         self.log_text.configure(yscrollcommand=scrollbar.set)
         
         # Control buttons
@@ -294,10 +339,12 @@ class EnhancedGUI:
         button_frame.pack(pady=5)
         
         ttk.Button(button_frame, text="Load Log", command=self.load_log).pack(side='left', padx=5)
-        ttk.Button(button_frame, text="Clear", command=lambda: self.log_text.delete(1.0, tk.END)).pack(side='left', padx=5)
+        ttk.Button(button_frame, text="Clear", command=self.clear_log).pack(side='left', padx=5)
         ttk.Button(button_frame, text="Auto-Scroll", command=self.toggle_autoscroll).pack(side='left', padx=5)
         
-        self.autoscroll = True
+        # Show anything buffered before the tab was built
+        if self._log_ring:
+            self._schedule_log_render()
     
     def create_status_bar(self):
         """Create status bar"""
@@ -331,37 +378,86 @@ class EnhancedGUI:
         # Start service in thread
         def run_service():
             try:
-                self.service_manager = ServiceManager()
+                self.service_manager = ServiceManager(ui_callback=self._on_service_event)
                 self.service_manager.config = self.config
                 self.service_manager.start()
                 
-                self.root.after(0, lambda: self.update_service_status("Running"))
-                self.root.after(0, lambda: self.start_btn.config(state='disabled'))
-                self.root.after(0, lambda: self.stop_btn.config(state='normal'))
+                self.root.after(0, self._apply_service_started)
                 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Service Error", str(e)))
+                self.root.after(0, self._apply_service_error, str(e))
         
-        service_thread = threading.Thread(target=run_service)
-        service_thread.daemon = True
-        service_thread.start()
+        future = self._svc_pool.submit(run_service)
+        future.add_done_callback(lambda f: self.root.after(0, self._svc_done, f))
         
         self.status_label.config(text="Service started")
     
+    def _apply_service_started(self):
+        """Update widgets once the service is running"""
+        self.update_service_status("Running")
+        self.start_btn.config(state='disabled')
+        self.stop_btn.config(state='normal')
+    
+    def _apply_service_error(self, message: str):
+        """Report a service start failure"""
+        messagebox.showerror("Service Error", message)
+    
+    def _on_service_event(self, kind, *payload):
+        """Service manager callback; runs on service threads"""
+        if kind == "log":
+            self.root.after(0, self.append_log, payload[0])
+    
+    def _svc_done(self, future):
+        """Surface unexpected errors from the service worker"""
+        error = future.exception()
+        if error:
+            self.logger.error(f"Service worker failed: {error}")
+            messagebox.showerror("Service Error", str(error))
+    
     def stop_service(self):
         """Stop the service"""
         if self.service_manager:
-            self.service_manager.stop()
-            self.update_service_status("Stopped")
-            self.start_btn.config(state='normal')
+            self.status_label.config(text="Stopping service...")
             self.stop_btn.config(state='disabled')
-            self.status_label.config(text="Service stopped")
             
-            # Show statistics
-            if self.service_manager._stats_tracker:
-                report = self.service_manager._stats_tracker.generate_report()
-                self.stats_text.delete(1.0, tk.END)
-                self.stats_text.insert(1.0, report)
+            # Stopping joins worker threads; keep it off the Tk thread
+            threading.Thread(target=self._stop_worker, daemon=True).start()
+    
+    def _stop_worker(self):
+        """Stop the service and build the report in a background thread"""
+        try:
+            self.service_manager.stop()
+        except Exception as e:
+            self.logger.error(f"Failed to stop service: {e}")
+            self.root.after(0, self._apply_stop_error, str(e))
+            return
+        
+        report = ''
+        try:
+            tracker = self.service_manager._stats_tracker
+            report = tracker.generate_report() if tracker else ''
+        except Exception as e:
+            self.logger.error(f"Failed to generate session report: {e}")
+        self.root.after(0, self._apply_stop_ui, report)
+    
+    def _apply_stop_error(self, message: str):
+        """Report a service stop failure and allow another attempt"""
+        self.stop_btn.config(state='normal')
+        self.status_label.config(text="Failed to stop service")
+        messagebox.showerror("Service Error", message)
+    
+    def _apply_stop_ui(self, report: str):
+        """Update widgets once the service has stopped"""
+        self.update_service_status("Stopped")
+        self.start_btn.config(state='normal')
+        self.stop_btn.config(state='disabled')
+        self.status_label.config(text="Service stopped")
+        
+        # Show statistics
+        if report:
+            self._build_tab(self.stats_frame)
+            self.stats_text.delete(1.0, tk.END)
+            self.stats_text.insert(1.0, report)
     
     def pause_service(self):
         """Pause the service"""
@@ -383,6 +479,7 @@ class EnhancedGUI:
     
     def validate_inputs(self) -> bool:
         """Validate user inputs"""
+        self._build_tab(self.config_frame)
         context = self.context_text.get(1.0, tk.END).strip()
         if not context:
             messagebox.showerror("Validation Error", "Please enter question context")
@@ -396,19 +493,28 @@ class EnhancedGUI:
     
     def update_config(self):
         """Update configuration from GUI values"""
-        self.config.set('context', self.context_text.get(1.0, tk.END).strip())
-        self.config.set('duration_minutes', self.duration_var.get())
-        self.config.set('num_questions', self.questions_var.get())
-        self.config.set('question_type', self.type_var.get())
-        self.config.set('api_key', self.api_key_var.get())
-        self.config.set('monitoring_interval', self.interval_var.get())
-        self.config.set('confidence_threshold', self.confidence_var.get())
-        self.config.set('tesseract_path', self.tesseract_var.get())
-        
-        # Advanced settings
-        self.config.set('performance.enable_caching', self.cache_var.get())
-        self.config.set('performance.parallel_processing', self.parallel_var.get())
-        self.config.set('ocr_preprocessing', self.ocr_preprocess_var.get())
+        self._build_tab(self.advanced_frame)
+        values = [
+            ('context', self.context_text.get(1.0, tk.END).strip()),
+            ('duration_minutes', self.duration_var.get()),
+            ('num_questions', self.questions_var.get()),
+            ('question_type', self.type_var.get()),
+            ('api_key', self._api_entry.get()),
+            ('monitoring_interval', self.interval_var.get()),
+            ('confidence_threshold', self._conf_pct.get() / 100.0),
+            ('tesseract_path', self.tesseract_var.get()),
+            
+            # Advanced settings
+            ('performance.enable_caching', self.cache_var.get()),
+            ('performance.parallel_processing', self.parallel_var.get()),
+            ('ocr_preprocessing', self.ocr_preprocess_var.get()),
+        ]
+        
+        # Config.set saves to disk, so only write keys that changed
+        for key, value in values:
+            if self._cfg_snapshot.get(key) != value:
+                self.config.set(key, value)
+                self._cfg_snapshot[key] = value
     
     def save_current_config(self):
         """Save current configuration"""
@@ -444,15 +550,29 @@ class EnhancedGUI:
     
     def populate_from_config(self):
         """Populate GUI from configuration"""
-        self.context_text.delete(1.0, tk.END)
-        self.context_text.insert(1.0, self.config.get('context', ''))
-        self.duration_var.set(self.config.get('duration_minutes', 60))
-        self.questions_var.set(self.config.get('num_questions', 10))
-        self.type_var.set(self.config.get('question_type', 'Multiple Choice'))
-        self.api_key_var.set(self.config.get('api_key', ''))
-        self.interval_var.set(self.config.get('monitoring_interval', 5))
-        self.confidence_var.set(self.config.get('confidence_threshold', 0.5))
-        self.tesseract_var.set(self.config.get('tesseract_path', r"C:\Program Files\Tesseract-OCR\tesseract.exe"))
+        self._build_tab(self.config_frame)
+        self._build_tab(self.advanced_frame)
+        self.context_text.replace(1.0, tk.END, self.config.get('context', ''))
+        self._api_entry.delete(0, tk.END)
+        self._api_entry.insert(0, self.config.get('api_key', ''))
+        
+        for var, value in (
+            (self.duration_var, int(self.config.get('duration_minutes', 60))),
+            (self.questions_var, int(self.config.get('num_questions', 10))),
+            (self.type_var, self.config.get('question_type', 'Multiple Choice')),
+            (self.interval_var, int(self.config.get('monitoring_interval', 5))),
+            (self._conf_pct, round(float(self.config.get('confidence_threshold', 0.5)) * 100)),
+            (self.tesseract_var, self.config.get('tesseract_path', r"C:\Program Files\Tesseract-OCR\tesseract.exe")),
+        ):
+            var.set(value)
+        self._update_confidence_label(self._conf_pct.get())
+        
+        # Remember what the config holds so update_config can skip unchanged keys
+        self._cfg_snapshot = {key: self.config.get(key) for key in self.CONFIG_KEYS}
+    
+    def _update_confidence_label(self, value):
+        """Show the confidence slider position as a 0-1 threshold"""
+        self._conf_label.config(text=f"{int(float(value)) / 100:.2f}")
     
     def browse_tesseract(self):
         """Browse for Tesseract executable"""
@@ -477,23 +597,175 @@ class EnhancedGUI:
     
     def refresh_stats(self):
         """Refresh statistics display"""
-        # This would load and display statistics
-        pass
+        # Throttle repopulation so bursts of refreshes don't hog the event loop
+        now = time.monotonic()
+        if now - self._last_stats_refresh < 1 / self._stats_max_hz:
+            return
+        self._last_stats_refresh = now
+        
+        self._build_tab(self.stats_frame)
+        
+        tracker = self.service_manager._stats_tracker if self.service_manager else None
+        if tracker:
+            history = tracker.get_historical_summary()
+        else:
+            history_file = Path('data/statistics/history.json')
+            try:
+                with open(history_file, 'r') as f:
+                    history = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                history = {}
+        
+        rows = {}
+        for session in history.get('sessions', []):
+            rows[session['session_id']] = (
+                session['session_id'],
+                session.get('questions_answered', 0),
+                f"{session.get('success_rate', 0.0):.1%}",
+                f"{session.get('total_runtime', 0.0) / 60:.1f} min"
+            )
+        
+        # Only touch rows that were added, removed or changed
+        for iid in self._hist_rows.keys() - rows.keys():
+            self.history_tree.delete(iid)
+        for iid, values in rows.items():
+            cached = self._hist_rows.get(iid)
+            if cached is None:
+                self.history_tree.insert('', 'end', iid=iid, values=values)
+            elif cached != values:
+                self.history_tree.item(iid, values=values)
+        self._hist_rows = rows
     
     def load_log(self):
         """Load log file"""
-        from pathlib import Path
         log_dir = Path("logs")
-        if log_dir.exists():
+        if not log_dir.exists():
+            return
+        
+        # Only rescan the directory when its entries changed
+        dir_mtime = log_dir.stat().st_mtime
+        cached_dir_mtime, latest_log = self._log_cache
+        if dir_mtime != cached_dir_mtime:
             log_files = list(log_dir.glob("*.log"))
-            if log_files:
-                latest_log = max(log_files, key=lambda p: p.stat().st_mtime)
-                with open(latest_log, 'r') as f:
-                    content = f.read()
-                    self.log_text.delete(1.0, tk.END)
-                    self.log_text.insert(1.0, content)
-                    if self.autoscroll:
-                        self.log_text.see(tk.END)
+            latest_log = max(log_files, key=lambda p: p.stat().st_mtime) if log_files else None
+            self._log_cache = (dir_mtime, latest_log)
+        if latest_log is None:
+            return
+        
+        # Nothing to do if the file is unchanged since it was last shown
+        stat = latest_log.stat()
+        sig = (latest_log, stat.st_size, stat.st_mtime)
+        if sig == self._log_sig:
+            return
+        self._log_sig = sig
+        
+        # Only read the tail up front; older content is streamed in
+        start = max(0, stat.st_size - self.LOG_TAIL_BYTES)
+        data = self._read_log_range(latest_log, start, stat.st_size)
+        start, data = self._trim_partial_line(start, data)
+        
+        self._log_stream_id += 1
+        self._log_ring.clear()
+        self._log_ring.extend(data.decode('utf-8', 'replace').splitlines())
+        self._schedule_log_render()
+        
+        if start and len(self._log_ring) < self._log_ring.maxlen:
+            self.root.after_idle(self._stream_more_log, latest_log, start, self._log_stream_id)
+    
+    def _stream_more_log(self, path, end, stream_id):
+        """Prepend the next older chunk of a log file, yielding between chunks"""
+        if stream_id != self._log_stream_id:
+            return  # superseded by a newer load or a clear
+        
+        room = self._log_ring.maxlen - len(self._log_ring)
+        if room <= 0:
+            return
+        
+        start = max(0, end - self.LOG_CHUNK_BYTES)
+        try:
+            data = self._read_log_range(path, start, end)
+        except OSError as e:
+            self.logger.warning(f"Failed to stream log {path}: {e}")
+            return
+        start, data = self._trim_partial_line(start, data)
+        
+        lines = data.decode('utf-8', 'replace').splitlines()
+        self._log_ring.extendleft(reversed(lines[-room:]))
+        self._schedule_log_render()
+        
+        if start:
+            self.root.after_idle(self._stream_more_log, path, start, stream_id)
+    
+    def append_log(self, line: str):
+        """Append a line to the log viewer"""
+        self._log_ring.append(line)
+        self._schedule_log_render()
+    
+    def _schedule_log_render(self):
+        """Coalesce log viewer redraws into one per event-loop iteration"""
+        if not self._log_render_pending:
+            self._log_render_pending = True
+            self.root.after_idle(self._render_log)
+    
+    def _render_log(self):
+        """Render the buffered log lines into the Text widget"""
+        self._log_render_pending = False
+        if str(self.logs_frame) in self._tab_builders:
+            return  # rendered when the Logs tab is first built
+        content = '\n'.join(self._log_ring)
+        content_hash = hash(content)
+        if content_hash == self._log_render_hash:
+            return
+        self._log_render_hash = content_hash
+        
+        self.log_text.replace(1.0, tk.END, content)
+        if self.autoscroll:
+            self._request_autoscroll()
+    
+    def _request_autoscroll(self):
+        """Scroll the log viewer to the end once per event-loop iteration"""
+        if not self._autoscroll_pending:
+            self._autoscroll_pending = True
+            self.root.after_idle(self._do_autoscroll)
+    
+    def _do_autoscroll(self):
+        """Run a pending autoscroll"""
+        self._autoscroll_pending = False
+        self.log_text.see(tk.END)
+    
+    @staticmethod
+    def _read_log_range(path, start, end):
+        """Read raw bytes [start, end) of a log file without text decoding"""
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            os.lseek(fd, start, os.SEEK_SET)
+            chunks = []
+            remaining = end - start
+            while remaining > 0:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            return b''.join(chunks)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _trim_partial_line(start, data):
+        """Drop a leading partial line unless the chunk starts the file"""
+        if start:
+            cut = data.find(b'\n') + 1
+            start += cut
+            data = data[cut:]
+        return start, data
+    
+    def clear_log(self):
+        """Clear the log viewer and stop any pending streaming"""
+        self._log_stream_id += 1
+        self._log_sig = None
+        self._log_ring.clear()
+        self._schedule_log_render()
     
     def toggle_autoscroll(self):
         """Toggle auto-scroll for logs"""
@@ -530,8 +802,10 @@ Advanced automated question detection and answering tool.
         if self.service_manager and self.service_manager.running:
             if messagebox.askokcancel("Quit", "Service is running. Stop and quit?"):
                 self.service_manager.stop()
+                self._svc_pool.shutdown(wait=False)
                 self.root.destroy()
         else:
+            self._svc_pool.shutdown(wait=False)
             self.root.destroy()
     
     def run(self):
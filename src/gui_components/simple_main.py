@@ -1,13 +1,10 @@
 """Simple, clean UI for Question Assistant"""
 import tkinter as tk
 import customtkinter as ctk
-from pathlib import Path
-import sys
 import threading
+import queue
 import time
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from src.core.config import Config
 from src.core.service_manager import ServiceManager
 from src.utils.logger import get_logger
@@ -16,10 +13,40 @@ from src.utils.logger import get_logger
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Fonts
+_FONT_TITLE = ("Arial", 18, "bold")
+_FONT_SECTION = ("Arial", 14, "bold")
+_FONT_STATUS_DOT = ("Arial", 16)
+_FONT_STATUS = ("Arial", 14)
+_FONT_LABEL = ("Arial", 12)
+_FONT_VALUE = ("Arial", 12, "bold")
+_FONT_SMALL = ("Arial", 11)
+_FONT_MONO = ("Consolas", 10)
+
 
 class SimpleAssistant(ctk.CTk):
     """Simple, functional UI for Question Assistant"""
     
+    # Lines kept in the activity log
+    LOG_MAX_LINES = 1000
+    
+    # Service statistic keys and the stats grid label they update
+    STAT_KEYS = {
+        "questions_detected": "Questions Detected",
+        "questions_answered": "Questions Answered",
+        "success_rate": "Success Rate"
+    }
+    
+    # Statistics shown in the stats grid, with initial values
+    STATS = (
+        ("Questions Detected", "0"),
+        ("Questions Answered", "0"),
+        ("Success Rate", "0%"),
+        ("Average Time", "0s"),
+        ("Current Session", "00:00:00"),
+        ("Total Sessions", "0")
+    )
+    
     def __init__(self):
         super().__init__()
         
@@ -33,6 +60,27 @@ class SimpleAssistant(ctk.CTk):
         self.service_manager = None
         self.logger = get_logger("GUI")
         self.is_running = False
+        self._last_elapsed = None
+        
+        # Worker -> UI messages, drained on the Tk thread while running
+        self._ui_queue = queue.Queue()
+        self._drain_after_id = None
+        self._timer_stop = None
+        
+        # Activity log messages waiting to be flushed
+        self._log_buf = []
+        self._log_flush_scheduled = False
+        
+        # Built after the first paint (see _create_ui)
+        self.stat_labels = {}
+        self.log_text = None
+        
+        # Label text is bound through Tk variables so updates skip widget reconfigures
+        self.status_var = tk.StringVar(value="Ready")
+        self.time_var = tk.StringVar(value="")
+        self.duration_var = tk.StringVar(value="30 min")
+        self._dur_after = None
+        self.stat_vars = {label: tk.StringVar(value=value) for label, value in self.STATS}
         
         # Colors
         self.colors = {
@@ -61,15 +109,18 @@ class SimpleAssistant(ctk.CTk):
     
     def _create_ui(self):
         """Create the main UI layout"""
+        c = self.colors
+        bg, card = c["bg"], c["card"]
+        
         # Main container
-        main_frame = ctk.CTkFrame(self, fg_color=self.colors["bg"])
+        main_frame = ctk.CTkFrame(self, fg_color=bg)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Top bar with controls
         self._create_top_bar(main_frame)
         
         # Main content area
-        content_frame = ctk.CTkFrame(main_frame, fg_color=self.colors["card"], corner_radius=10)
+        content_frame = ctk.CTkFrame(main_frame, fg_color=card, corner_radius=10)
         content_frame.pack(fill="both", expand=True, pady=(10, 0))
         
         # Two column layout
@@ -82,15 +133,16 @@ class SimpleAssistant(ctk.CTk):
         # Configuration section
         self._create_config_section(left_column)
         
-        # Statistics section
-        self._create_stats_section(right_column)
-        
-        # Activity log at bottom
-        self._create_activity_log(main_frame)
+        # Statistics and activity log are built once the window has painted
+        self.after_idle(self._create_stats_section, right_column)
+        self.after_idle(self._create_activity_log, main_frame)
     
     def _create_top_bar(self, parent):
         """Create top control bar"""
-        top_bar = ctk.CTkFrame(parent, fg_color=self.colors["card"], height=60, corner_radius=10)
+        c = self.colors
+        card, text_dim, text_fg, accent, error = c["card"], c["text_dim"], c["text"], c["accent"], c["error"]
+        
+        top_bar = ctk.CTkFrame(parent, fg_color=card, height=60, corner_radius=10)
         top_bar.pack(fill="x")
         top_bar.pack_propagate(False)
         
@@ -105,16 +157,16 @@ class SimpleAssistant(ctk.CTk):
         self.status_dot = ctk.CTkLabel(
             self.status_frame,
             text="●",
-            font=("Arial", 16),
-            text_color=self.colors["text_dim"]
+            font=_FONT_STATUS_DOT,
+            text_color=text_dim
         )
         self.status_dot.pack(side="left", padx=(0, 10))
         
         self.status_label = ctk.CTkLabel(
             self.status_frame,
-            text="Ready",
-            font=("Arial", 14),
-            text_color=self.colors["text"]
+            textvariable=self.status_var,
+            font=_FONT_STATUS,
+            text_color=text_fg
         )
         self.status_label.pack(side="left")
         
@@ -128,7 +180,7 @@ class SimpleAssistant(ctk.CTk):
             width=100,
             height=35,
             command=self._start_service,
-            fg_color=self.colors["accent"],
+            fg_color=accent,
             hover_color="#3a8eef"
         )
         self.start_btn.pack(side="left", padx=5)
@@ -139,7 +191,7 @@ class SimpleAssistant(ctk.CTk):
             width=100,
             height=35,
             command=self._stop_service,
-            fg_color=self.colors["error"],
+            fg_color=error,
             hover_color="#d32f2f",
             state="disabled"
         )
@@ -148,20 +200,23 @@ class SimpleAssistant(ctk.CTk):
         # Time remaining
         self.time_label = ctk.CTkLabel(
             controls,
-            text="",
-            font=("Arial", 12),
-            text_color=self.colors["text_dim"]
+            textvariable=self.time_var,
+            font=_FONT_LABEL,
+            text_color=text_dim
         )
         self.time_label.pack(side="right", padx=20)
     
     def _create_config_section(self, parent):
         """Create configuration section"""
+        c = self.colors
+        text_fg, text_dim, sidebar, accent = c["text"], c["text_dim"], c["sidebar"], c["accent"]
+        
         # Title
         title = ctk.CTkLabel(
             parent,
             text="Configuration",
-            font=("Arial", 18, "bold"),
-            text_color=self.colors["text"]
+            font=_FONT_TITLE,
+            text_color=text_fg
         )
         title.pack(anchor="w", pady=(0, 15))
         
@@ -169,8 +224,8 @@ class SimpleAssistant(ctk.CTk):
         context_label = ctk.CTkLabel(
             parent,
             text="Context/Subject:",
-            font=("Arial", 12),
-            text_color=self.colors["text_dim"]
+            font=_FONT_LABEL,
+            text_color=text_dim
         )
         context_label.pack(anchor="w", pady=(10, 5))
         
@@ -178,8 +233,8 @@ class SimpleAssistant(ctk.CTk):
             parent,
             placeholder_text="e.g., Mathematics, History, Science",
             height=35,
-            fg_color=self.colors["sidebar"],
-            border_color=self.colors["accent"],
+            fg_color=sidebar,
+            border_color=accent,
             border_width=1
         )
         self.context_entry.pack(fill="x", pady=(0, 10))
@@ -188,8 +243,8 @@ class SimpleAssistant(ctk.CTk):
         duration_label = ctk.CTkLabel(
             parent,
             text="Duration (minutes):",
-            font=("Arial", 12),
-            text_color=self.colors["text_dim"]
+            font=_FONT_LABEL,
+            text_color=text_dim
         )
         duration_label.pack(anchor="w", pady=(10, 5))
         
@@ -201,8 +256,8 @@ class SimpleAssistant(ctk.CTk):
             from_=5,
             to=180,
             number_of_steps=35,
-            progress_color=self.colors["accent"],
-            button_color=self.colors["accent"],
+            progress_color=accent,
+            button_color=accent,
             button_hover_color="#3a8eef"
         )
         self.duration_slider.set(30)
@@ -210,9 +265,9 @@ class SimpleAssistant(ctk.CTk):
         
         self.duration_value = ctk.CTkLabel(
             duration_frame,
-            text="30 min",
-            font=("Arial", 12),
-            text_color=self.colors["text"]
+            textvariable=self.duration_var,
+            font=_FONT_LABEL,
+            text_color=text_fg
         )
         self.duration_value.pack(side="right", padx=(10, 0))
         
@@ -222,8 +277,8 @@ class SimpleAssistant(ctk.CTk):
         api_label = ctk.CTkLabel(
             parent,
             text="API Key (optional):",
-            font=("Arial", 12),
-            text_color=self.colors["text_dim"]
+            font=_FONT_LABEL,
+            text_color=text_dim
         )
         api_label.pack(anchor="w", pady=(10, 5))
         
@@ -232,8 +287,8 @@ class SimpleAssistant(ctk.CTk):
             placeholder_text="sk-...",
             height=35,
             show="*",
-            fg_color=self.colors["sidebar"],
-            border_color=self.colors["accent"],
+            fg_color=sidebar,
+            border_color=accent,
             border_width=1
         )
         self.api_entry.pack(fill="x", pady=(0, 10))
@@ -242,17 +297,17 @@ class SimpleAssistant(ctk.CTk):
         options_label = ctk.CTkLabel(
             parent,
             text="Options:",
-            font=("Arial", 12),
-            text_color=self.colors["text_dim"]
+            font=_FONT_LABEL,
+            text_color=text_dim
         )
         options_label.pack(anchor="w", pady=(10, 5))
         
         self.auto_detect = ctk.CTkCheckBox(
             parent,
             text="Auto-detect questions",
-            fg_color=self.colors["accent"],
+            fg_color=accent,
             hover_color="#3a8eef",
-            text_color=self.colors["text"]
+            text_color=text_fg
         )
         self.auto_detect.pack(anchor="w", pady=2)
         self.auto_detect.select()
@@ -260,52 +315,46 @@ class SimpleAssistant(ctk.CTk):
         self.sound_enabled = ctk.CTkCheckBox(
             parent,
             text="Sound notifications",
-            fg_color=self.colors["accent"],
+            fg_color=accent,
             hover_color="#3a8eef",
-            text_color=self.colors["text"]
+            text_color=text_fg
         )
         self.sound_enabled.pack(anchor="w", pady=2)
     
     def _create_stats_section(self, parent):
         """Create statistics section"""
+        c = self.colors
+        text_fg, sidebar, text_dim, accent = c["text"], c["sidebar"], c["text_dim"], c["accent"]
+        
         # Title
         title = ctk.CTkLabel(
             parent,
             text="Statistics",
-            font=("Arial", 18, "bold"),
-            text_color=self.colors["text"]
+            font=_FONT_TITLE,
+            text_color=text_fg
         )
         title.pack(anchor="w", pady=(0, 15))
         
         # Stats grid
-        stats = [
-            ("Questions Detected", "0"),
-            ("Questions Answered", "0"),
-            ("Success Rate", "0%"),
-            ("Average Time", "0s"),
-            ("Current Session", "00:00:00"),
-            ("Total Sessions", "0")
-        ]
-        
         self.stat_labels = {}
         
-        for label, value in stats:
-            stat_frame = ctk.CTkFrame(parent, fg_color=self.colors["sidebar"], corner_radius=8)
+        for label, _ in self.STATS:
+            stat_frame = ctk.CTkFrame(parent, fg_color=sidebar, corner_radius=8)
             stat_frame.pack(fill="x", pady=5)
             
             label_widget = ctk.CTkLabel(
                 stat_frame,
                 text=label,
-                font=("Arial", 11),
-                text_color=self.colors["text_dim"]
+                font=_FONT_SMALL,
+                text_color=text_dim
             )
             label_widget.pack(side="left", padx=15, pady=10)
             
             value_widget = ctk.CTkLabel(
                 stat_frame,
-                text=value,
-                font=("Arial", 12, "bold"),
-                text_color=self.colors["accent"]
+                textvariable=self.stat_vars[label],
+                font=_FONT_VALUE,
+                text_color=accent
             )
             value_widget.pack(side="right", padx=15, pady=10)
             
@@ -313,8 +362,11 @@ class SimpleAssistant(ctk.CTk):
     
     def _create_activity_log(self, parent):
         """Create activity log section"""
+        c = self.colors
+        card, text_fg, sidebar, text_dim = c["card"], c["text"], c["sidebar"], c["text_dim"]
+        
         # Log frame
-        log_frame = ctk.CTkFrame(parent, fg_color=self.colors["card"], height=150, corner_radius=10)
+        log_frame = ctk.CTkFrame(parent, fg_color=card, height=150, corner_radius=10)
         log_frame.pack(fill="x", pady=(10, 0))
         log_frame.pack_propagate(False)
         
@@ -322,8 +374,8 @@ class SimpleAssistant(ctk.CTk):
         log_title = ctk.CTkLabel(
             log_frame,
             text="Activity Log",
-            font=("Arial", 14, "bold"),
-            text_color=self.colors["text"]
+            font=_FONT_SECTION,
+            text_color=text_fg
         )
         log_title.pack(anchor="w", padx=20, pady=(10, 5))
         
@@ -331,23 +383,61 @@ class SimpleAssistant(ctk.CTk):
         self.log_text = ctk.CTkTextbox(
             log_frame,
             height=100,
-            fg_color=self.colors["sidebar"],
-            text_color=self.colors["text_dim"],
-            font=("Consolas", 10)
+            fg_color=sidebar,
+            text_color=text_dim,
+            font=_FONT_MONO
         )
         self.log_text.pack(fill="both", expand=True, padx=20, pady=(0, 10))
         self.log_text.insert("1.0", "Ready to start...\n")
+        self._log_lines = 1
         self.log_text.configure(state="disabled")
     
     def _update_duration(self, value):
-        """Update duration label"""
-        self.duration_value.configure(text=f"{int(value)} min")
+        """Update duration label (debounced while the slider is dragged)"""
+        if self._dur_after:
+            self.after_cancel(self._dur_after)
+        self._dur_after = self.after(30, self._apply_duration, value)
+    
+    def _apply_duration(self, value):
+        """Show the selected duration"""
+        self._dur_after = None
+        self.duration_var.set(f"{int(value)} min")
     
     def _add_log(self, message):
         """Add message to activity log"""
-        self.log_text.configure(state="normal")
         timestamp = time.strftime("%H:%M:%S")
-        self.log_text.insert("end", f"[{timestamp}] {message}\n")
+        self._log_buf.append(f"[{timestamp}] {message}\n")
+        
+        # Batch messages so the textbox is redrawn once per flush
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.after(100, self._flush_log)
+    
+    def _flush_log(self):
+        """Write buffered log messages to the activity log"""
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        
+        if self.log_text is None:
+            # Activity log not built yet; try again shortly
+            self._log_flush_scheduled = True
+            self.after(100, self._flush_log)
+            return
+        
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        self._log_lines += text.count("\n")
+        
+        self.log_text.configure(state="normal")
+        self.log_text.insert("end", text)
+        
+        # Drop the oldest lines so the textbox stays small
+        excess = self._log_lines - self.LOG_MAX_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = self.LOG_MAX_LINES
+        
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
     
@@ -364,7 +454,7 @@ class SimpleAssistant(ctk.CTk):
                 self.config.set('api_key', self.api_entry.get())
             
             # Start service
-            self.service_manager = ServiceManager()
+            self.service_manager = ServiceManager(ui_callback=self._post_ui)
             self.service_manager.config = self.config
             
             # Start in thread
@@ -377,17 +467,20 @@ class SimpleAssistant(ctk.CTk):
             self.start_btn.configure(state="disabled")
             self.stop_btn.configure(state="normal")
             self.status_dot.configure(text_color=self.colors["success"])
-            self.status_label.configure(text="Running")
+            self.status_var.set("Running")
             
-            self._add_log("Service started successfully")
+            self._add_log("Starting service...")
             
-            # Start timer update
-            self._update_timer()
+            # Start timer updates from a worker; the UI only wakes to drain them
+            self._timer_stop = threading.Event()
+            threading.Thread(target=self._post_elapsed, args=(self._timer_stop,), daemon=True).start()
+            if self._drain_after_id is None:
+                self._drain_ui_queue()
             
         except Exception as e:
             self._add_log(f"Error starting service: {str(e)}")
             self.status_dot.configure(text_color=self.colors["error"])
-            self.status_label.configure(text="Error")
+            self.status_var.set("Error")
     
     def _stop_service(self):
         """Stop the service"""
@@ -395,6 +488,9 @@ class SimpleAssistant(ctk.CTk):
             return
         
         try:
+            if self._timer_stop:
+                self._timer_stop.set()
+            
             if self.service_manager:
                 self.service_manager.running = False
                 self.service_manager.stop()
@@ -405,32 +501,113 @@ class SimpleAssistant(ctk.CTk):
             self.start_btn.configure(state="normal")
             self.stop_btn.configure(state="disabled")
             self.status_dot.configure(text_color=self.colors["text_dim"])
-            self.status_label.configure(text="Ready")
-            self.time_label.configure(text="")
+            self.status_var.set("Ready")
+            self.time_var.set("")
+            self._last_elapsed = None
             
             self._add_log("Service stopped")
             
         except Exception as e:
             self._add_log(f"Error stopping service: {str(e)}")
     
-    def _update_timer(self):
-        """Update timer display"""
-        if self.is_running and self.service_manager:
-            if self.service_manager.start_time:
-                elapsed = time.time() - self.service_manager.start_time.timestamp()
-                hours = int(elapsed // 3600)
-                minutes = int((elapsed % 3600) // 60)
-                seconds = int(elapsed % 60)
+    def _post_elapsed(self, stop_event):
+        """Post elapsed service time to the UI queue once per second"""
+        while not stop_event.is_set():
+            manager = self.service_manager
+            if manager and manager.start_time:
+                elapsed = time.time() - manager.start_time.timestamp()
+                self._ui_queue.put(("elapsed", elapsed))
                 
-                self.time_label.configure(text=f"Elapsed: {hours:02d}:{minutes:02d}:{seconds:02d}")
-                
-                # Update session time stat
-                self.stat_labels["Current Session"].configure(
-                    text=f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                )
+                # Wake up just after the next whole second of elapsed time
+                delay = 1.01 - elapsed % 1
+            else:
+                delay = 0.1
+            stop_event.wait(delay)
+    
+    def _post_ui(self, *message):
+        """Queue a message for the UI (safe to call from any thread)"""
+        self._ui_queue.put(message)
+    
+    def _drain_ui_queue(self):
+        """Apply pending worker updates on the Tk thread"""
+        latest = {}
+        stats = {}
+        logs = []
+        while True:
+            try:
+                message = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
             
-            # Schedule next update
-            self.after(1000, self._update_timer)
+            kind = message[0]
+            if kind == "log":
+                logs.append(message[1])
+            elif kind == "stat":
+                stats[message[1]] = message[2]
+            else:
+                # Only the newest value of each kind is worth drawing
+                latest[kind] = message[1]
+        
+        if not self.is_running:
+            self._drain_after_id = None
+            return
+        
+        for text in logs:
+            self._add_log(text)
+        for key, value in stats.items():
+            self._update_stat(key, value)
+        if "elapsed" in latest:
+            self._update_timer(latest["elapsed"])
+        if "status" in latest:
+            self._apply_service_status(latest["status"])
+        
+        if self.is_running:
+            self._drain_after_id = self.after(250, self._drain_ui_queue)
+        else:
+            self._drain_after_id = None
+    
+    def _update_stat(self, key, value):
+        """Show a statistic reported by the service"""
+        label = self.STAT_KEYS.get(key)
+        if label:
+            self.stat_vars[label].set(f"{value:.0%}" if key == "success_rate" else str(value))
+    
+    def _apply_service_status(self, state):
+        """Reflect a service state change reported by the service"""
+        if state == "Error":
+            if self._timer_stop:
+                self._timer_stop.set()
+            self.service_manager = None
+            
+            self.is_running = False
+            self.start_btn.configure(state="normal")
+            self.stop_btn.configure(state="disabled")
+            self.status_dot.configure(text_color=self.colors["error"])
+            self.status_var.set("Error")
+            self.time_var.set("")
+            self._last_elapsed = None
+        elif state == "Running":
+            self.status_var.set("Running")
+            self._add_log("Service started successfully")
+        elif state == "Paused":
+            self.status_var.set("Paused")
+    
+    def _update_timer(self, elapsed):
+        """Update timer display"""
+        # Skip redraws (and formatting) when the displayed second has not changed
+        total_seconds = int(elapsed)
+        if total_seconds == self._last_elapsed:
+            return
+        self._last_elapsed = total_seconds
+        
+        total_minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(total_minutes, 60)
+        time_str = "%02d:%02d:%02d" % (hours, minutes, seconds)
+        
+        self.time_var.set("Elapsed: " + time_str)
+        
+        # Update session time stat
+        self.stat_vars["Current Session"].set(time_str)
     
     def _on_closing(self):
         """Handle window closing"""
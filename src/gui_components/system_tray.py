@@ -2,43 +2,73 @@
 import pystray
 from PIL import Image, ImageDraw
 import threading
-from typing import Optional, Callable
+import queue
+import tkinter as tk
+from typing import Optional, Callable, Dict, Tuple
+from src.utils.logger import get_logger
+
+def _make_icon(size=64, color="#0d7377"):
+    """Create icon image"""
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    
+    # Draw a circle with Q
+    draw.ellipse([2, 2, size-2, size-2], fill=color)
+    
+    # Draw Q letter (simplified)
+    draw.ellipse([size//4, size//4, 3*size//4, 3*size//4], 
+                fill=(255, 255, 255, 255))
+    draw.ellipse([3*size//8, 3*size//8, 5*size//8, 5*size//8], 
+                fill=color)
+    
+    # Draw tail of Q
+    draw.rectangle([size//2, size//2, 3*size//4, 3*size//4], 
+                  fill=(255, 255, 255, 255))
+    
+    return image
+
+# Rendered icons shared by every tray instance, keyed by (size, color)
+_ICON_CACHE: Dict[Tuple[int, str], Image.Image] = {}
+
+def get_icon(size: int, color: str) -> Image.Image:
+    """Get a cached icon image, rendering it on first use"""
+    key = (size, color)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = _ICON_CACHE[key] = _make_icon(size, color)
+    return icon
+
+_DEFAULT_ICON = get_icon(64, "#0d7377")
 
 class SystemTray:
     """System tray icon with menu"""
     
+    DEFAULT_COLOR = "#0d7377"
+    STATUS_COLORS = {
+        "running": "#27ae60",  # Green
+        "paused": "#f39c12",   # Orange
+        "stopped": "#e74c3c"   # Red
+    }
+    
     def __init__(self, app_window, service_manager):
         self.app_window = app_window
         self.service_manager = service_manager
         self.icon = None
         self.running = False
+        self.logger = get_logger("SystemTray")
+        
+        # Tk is not thread-safe: pystray callbacks queue window work here and
+        # the Tk main thread runs it
+        self._window = getattr(app_window, 'root', app_window)
+        self._main_q = queue.Queue()
+        self._window.after(50, self._pump_main_q)
         
-        # Create icon image
-        self.icon_image = self._create_icon_image()
+        # Icons are rendered once per process and shared
+        self.icon_image = _DEFAULT_ICON
         
         # Create system tray icon
         self._create_tray_icon()
     
-    def _create_icon_image(self, size=64, color="#0d7377"):
-        """Create icon image"""
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # Draw a circle with Q
-        draw.ellipse([2, 2, size-2, size-2], fill=color)
-        
-        # Draw Q letter (simplified)
-        draw.ellipse([size//4, size//4, 3*size//4, 3*size//4], 
-                    fill=(255, 255, 255, 255))
-        draw.ellipse([3*size//8, 3*size//8, 5*size//8, 5*size//8], 
-                    fill=color)
-        
-        # Draw tail of Q
-        draw.rectangle([size//2, size//2, 3*size//4, 3*size//4], 
-                      fill=(255, 255, 255, 255))
-        
-        return image
-    
     def _create_tray_icon(self):
         """Create the system tray icon"""
         menu = pystray.Menu(
@@ -79,14 +109,37 @@ class SystemTray:
             self.running = False
             self.icon.stop()
     
+    def _pump_main_q(self):
+        """Run window calls queued by the tray thread (Tk main thread only)"""
+        while True:
+            try:
+                fn = self._main_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
+            except Exception as e:
+                self.logger.error(f"Tray window action failed: {e}")
+        
+        # Stop pumping once the window is gone
+        try:
+            if self._window.winfo_exists():
+                self._window.after(50, self._pump_main_q)
+        except tk.TclError:
+            pass
+    
     def _show_window(self, icon, item):
         """Show main window"""
-        self.app_window.root.deiconify()
-        self.app_window.root.lift()
+        self._main_q.put(self._raise_window)
+    
+    def _raise_window(self):
+        """Deiconify and raise the main window"""
+        self._window.deiconify()
+        self._window.lift()
     
     def _hide_window(self, icon, item):
         """Hide main window"""
-        self.app_window.root.withdraw()
+        self._main_q.put(self._window.withdraw)
     
     def _start_service(self, icon, item):
         """Start service from tray"""
@@ -110,6 +163,10 @@ class SystemTray:
         """Show statistics window"""
         # Show main window and switch to stats tab
         self._show_window(icon, item)
+        self._main_q.put(self._select_stats_tab)
+    
+    def _select_stats_tab(self):
+        """Switch the main window to its statistics tab"""
         if hasattr(self.app_window, 'notebook'):
             # Switch to statistics tab
             for i, tab in enumerate(self.app_window.notebook.tabs()):
@@ -122,18 +179,12 @@ class SystemTray:
         self.stop()
         if self.service_manager and self.service_manager.running:
             self.service_manager.stop()
-        self.app_window.root.quit()
+        self._main_q.put(self._window.quit)
     
     def _update_icon_status(self, status):
         """Update icon based on status"""
-        colors = {
-            "running": "#27ae60",  # Green
-            "paused": "#f39c12",   # Orange
-            "stopped": "#e74c3c"   # Red
-        }
-        
-        color = colors.get(status, "#0d7377")
-        self.icon_image = self._create_icon_image(color=color)
+        color = self.STATUS_COLORS.get(status, self.DEFAULT_COLOR)
+        self.icon_image = get_icon(64, color)
         
         if self.icon:
             self.icon.icon = self.icon_image
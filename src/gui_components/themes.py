@@ -1,7 +1,17 @@
 """Modern theme system for the application"""
 from typing import Dict, Any
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 class ThemeManager:
     """Manages application themes and styling"""
@@ -129,15 +139,57 @@ class ThemeManager:
         "pulse_scale": 1.05
     }
     
+    # Built-in settings are read-only and shared by every consumer
+    THEMES = MappingProxyType({
+        name: MappingProxyType({**theme, "chart_colors": tuple(theme["chart_colors"])})
+        for name, theme in THEMES.items()
+    })
+    FONTS = MappingProxyType(FONTS)
+    ANIMATIONS = MappingProxyType(ANIMATIONS)
+    
     def __init__(self):
         self.current_theme = "dark"
-        self.custom_themes = self._load_custom_themes()
+        self._custom_themes_cache = None
+        self._theme_rgb_cache = {}
+        self._current = None
+        self._subscribers = []
+    
+    @property
+    def current(self) -> Dict[str, Any]:
+        """Current theme, resolved once per theme change"""
+        if self._current is None:
+            self._current = self.get_theme(self.current_theme)
+        return self._current
+    
+    def subscribe(self, callback):
+        """Call callback() whenever the current theme changes"""
+        self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback):
+        """Stop notifying callback of theme changes"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    
+    def _theme_changed(self):
+        """Drop the resolved theme and notify subscribers"""
+        self._current = None
+        for callback in list(self._subscribers):
+            callback()
+    
+    @property
+    def custom_themes(self) -> Dict:
+        """Custom themes, loaded from disk on first access"""
+        if self._custom_themes_cache is None:
+            self._custom_themes_cache = self._load_custom_themes()
+        return self._custom_themes_cache
     
     def _load_custom_themes(self) -> Dict:
         """Load custom themes from file"""
         theme_file = Path("config/custom_themes.json")
         if theme_file.exists():
             try:
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(theme_file.read_bytes())
                 with open(theme_file, 'r') as f:
                     return json.load(f)
             except:
@@ -147,17 +199,36 @@ class ThemeManager:
     def get_theme(self, theme_name: str = None) -> Dict[str, Any]:
         """Get theme configuration"""
         if theme_name is None:
-            theme_name = self.current_theme
+            return self.current
         
         if theme_name in self.custom_themes:
             return self.custom_themes[theme_name]
         
         return self.THEMES.get(theme_name, self.THEMES["dark"])
     
+    def get_theme_rgb(self, theme_name: str = None) -> Dict[str, np.ndarray]:
+        """Get theme hex colors pre-parsed to read-only uint8 RGB arrays"""
+        if theme_name is None:
+            theme_name = self.current_theme
+        
+        theme_rgb = self._theme_rgb_cache.get(theme_name)
+        if theme_rgb is None:
+            theme_rgb = {}
+            for key, value in self.get_theme(theme_name).items():
+                if isinstance(value, str) and value.startswith("#") and len(value) == 7:
+                    value = int(value[1:], 16)
+                    rgb = np.array([(value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff], dtype=np.uint8)
+                    rgb.flags.writeable = False
+                    theme_rgb[key] = rgb
+            theme_rgb = self._theme_rgb_cache[theme_name] = MappingProxyType(theme_rgb)
+        return theme_rgb
+    
     def set_theme(self, theme_name: str):
         """Set current theme"""
         if theme_name in self.THEMES or theme_name in self.custom_themes:
-            self.current_theme = theme_name
+            if theme_name != self.current_theme:
+                self.current_theme = theme_name
+                self._theme_changed()
             return True
         return False
     
@@ -171,33 +242,43 @@ class ThemeManager:
     
     def save_custom_theme(self, name: str, theme: Dict):
         """Save a custom theme"""
-        self.custom_themes[name] = theme
+        self.custom_themes[name] = dict(theme)
+        self._theme_rgb_cache.pop(name, None)
         theme_file = Path("config/custom_themes.json")
         theme_file.parent.mkdir(exist_ok=True)
         
-        with open(theme_file, 'w') as f:
-            json.dump(self.custom_themes, f, indent=2)
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.custom_themes, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.custom_themes, indent=2).encode('utf-8')
+        
+        # Write to a temp file and swap it in so a crash never leaves a truncated file
+        tmp_file = theme_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, theme_file)
+        
+        if name == self.current_theme:
+            self._theme_changed()
     
     def get_gradient(self, steps: int = 10) -> list:
         """Generate gradient colors for current theme"""
         theme = self.get_theme()
-        start = theme["gradient_start"]
-        end = theme["gradient_end"]
-        
-        # Convert hex to RGB
-        start_rgb = tuple(int(start[i:i+2], 16) for i in (1, 3, 5))
-        end_rgb = tuple(int(end[i:i+2], 16) for i in (1, 3, 5))
-        
-        # Generate gradient
-        colors = []
-        for i in range(steps):
-            t = i / (steps - 1) if steps > 1 else 0
-            r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * t)
-            g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * t)
-            b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * t)
-            colors.append(f"#{r:02x}{g:02x}{b:02x}")
-        
-        return colors
+        return list(_gradient(theme["gradient_start"], theme["gradient_end"], steps))
+
+@lru_cache(maxsize=32)
+def _gradient(start: str, end: str, steps: int) -> tuple:
+    """Interpolate hex colors between two endpoints (cached per endpoint pair)"""
+    # Convert hex to RGB
+    start_value = int(start[1:], 16)
+    end_value = int(end[1:], 16)
+    start_rgb = np.array([(start_value >> 16) & 0xff, (start_value >> 8) & 0xff, start_value & 0xff], dtype=np.float64)
+    end_rgb = np.array([(end_value >> 16) & 0xff, (end_value >> 8) & 0xff, end_value & 0xff], dtype=np.float64)
+    
+    # Generate gradient
+    t = np.linspace(0, 1, max(steps, 0))
+    rgb = (start_rgb + (end_rgb - start_rgb) * t[:, None]).astype(np.uint32)
+    packed = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+    return tuple("#%06x" % value for value in packed.tolist())
 
 # Global theme manager instance
 theme_manager = ThemeManager()
\ No newline at end of file
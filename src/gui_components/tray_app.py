@@ -1,20 +1,48 @@
 """System tray application for Question Assistant"""
 import sys
 import threading
-import time
-from pathlib import Path
-import customtkinter as ctk
-import pystray
-from PIL import Image, ImageDraw
-from pystray import MenuItem as item
+import queue
+import concurrent.futures
+from functools import lru_cache
 import tkinter as tk
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from src.core.config import Config
 from src.core.service_manager import ServiceManager
 from src.utils.logger import get_logger
-from src.gui_components.simple_main import SimpleAssistant
+
+
+@lru_cache(maxsize=1)
+def _icon_layers():
+    """Build the transparent icon template and the "Q" overlay once"""
+    from PIL import Image, ImageDraw, ImageFont
+    
+    # The TrueType font is parsed here only, never per icon render
+    try:
+        font = ImageFont.truetype("arial.ttf", 24)
+        origin = (28, 20)
+    except OSError:
+        font = ImageFont.load_default()
+        origin = (26, 20)
+    
+    base = Image.new('RGBA', (64, 64), (0, 0, 0, 0))
+    q_layer = base.copy()
+    ImageDraw.Draw(q_layer).text(origin, "Q", fill="white", font=font)
+    return base, q_layer
+
+
+@lru_cache(maxsize=8)
+def _render_icon(running, color):
+    """Render a tray icon; the result is shared, so callers must not mutate it"""
+    from PIL import ImageDraw
+    
+    # Copy the template, draw the state dot and composite the cached "Q"
+    base, q_layer = _icon_layers()
+    image = base.copy()
+    # Green dot when running, idle color otherwise
+    ImageDraw.Draw(image).ellipse([16, 16, 48, 48], fill="#4caf50" if running else color)
+    image.alpha_composite(q_layer)
+    
+    return image
 
 
 class TrayApplication:
@@ -25,201 +53,311 @@ class TrayApplication:
         self.service_manager = None
         self.logger = get_logger("TrayApp")
         self.is_running = False
-        self.window = None
         self.icon = None
+        self.root = None
+        self.window = None
         self.window_visible = False
+        self.command_queue = queue.Queue()
         
-        # Create system tray icon
-        self._create_tray_icon()
+        # Serializes start/stop so racing tray and window clicks can't
+        # launch the service twice
+        self._svc_lock = threading.Lock()
         
-        # Auto-start in tray
-        self.logger.info("Question Assistant started in system tray")
-    
-    def _create_icon_image(self, color="#4a9eff"):
-        """Create icon image for system tray"""
-        # Create a simple icon
-        width = 64
-        height = 64
-        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
+        # One long-lived worker runs ServiceManager.start across toggles
+        self._svc_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="svc")
         
-        # Draw a circle for the icon
-        if self.is_running:
-            # Green dot when running
-            draw.ellipse([16, 16, 48, 48], fill="#4caf50")
-        else:
-            # Blue dot when idle
-            draw.ellipse([16, 16, 48, 48], fill=color)
+        # Live service counters, pushed to subscribers on the Tk thread
+        self.stats = {"questions_detected": 0, "questions_answered": 0}
+        self._stats_listeners = []
         
-        # Add Q letter
-        try:
-            from PIL import ImageFont
-            # Try to use a font
-            font = ImageFont.truetype("arial.ttf", 24)
-            draw.text((28, 20), "Q", fill="white", font=font)
-        except:
-            # Fallback to default font
-            draw.text((28, 24), "Q", fill="white")
+        # Balloon notifications are batched off the start/stop path
+        self._notif_q = queue.Queue()
+        threading.Thread(target=self._notify_worker, daemon=True, name="tray-notify").start()
+        
+        # Icons are rendered on first use; _render_icon caches each state
+        self._last_icon_state = None
+        
+        # Setup main thread for GUI
+        self._setup_gui_thread()
         
-        return image
+        self.logger.info("Question Assistant started in system tray")
+    
+    def _setup_gui_thread(self):
+        """Setup GUI in main thread"""
+        # Create root window in main thread
+        self.root = tk.Tk()
+        self.root.withdraw()  # Hide the root window
+        
+        # Drain anything queued before the root existed
+        self._drain_queue()
+    
+    def _enqueue(self, command):
+        """Queue a command and wake Tk to run it on the next idle turn"""
+        self.command_queue.put(command)
+        try:
+            self.root.after_idle(self._drain_queue)
+        except Exception as e:
+            self.logger.error(f"Error scheduling queue drain: {e}")
+    
+    def _drain_queue(self):
+        """Run every pending command from the queue in one pass"""
+        try:
+            while True:
+                try:
+                    command = self.command_queue.get_nowait()
+                    command()
+                except queue.Empty:
+                    break
+        except Exception as e:
+            self.logger.error(f"Error processing queue: {e}")
+    
+    def _create_icon_image(self, running=False, color="#4a9eff"):
+        """Create icon image for system tray"""
+        return _render_icon(running, color)
     
     def _create_tray_icon(self):
         """Create system tray icon with menu"""
-        # Create icon
-        image = self._create_icon_image()
+        import pystray
+        from pystray import MenuItem as item
         
         # Create menu
         menu = pystray.Menu(
-            item('Show/Hide Window', self._toggle_window, default=True),
-            item('Start Service', self._start_from_tray, visible=lambda item: not self.is_running),
-            item('Stop Service', self._stop_from_tray, visible=lambda item: self.is_running),
+            item('Show Window', self._queue_show_window, default=True),
+            item('Hide Window', self._queue_hide_window),
+            pystray.Menu.SEPARATOR,
+            item('Start Service', self._queue_start_service, visible=lambda item: not self.is_running),
+            item('Stop Service', self._queue_stop_service, visible=lambda item: self.is_running),
             pystray.Menu.SEPARATOR,
-            item('Configuration', self._show_config),
-            item('View Logs', self._show_logs),
+            item('Configuration', self._queue_show_config),
+            item('View Logs', self._queue_show_logs),
             pystray.Menu.SEPARATOR,
-            item('Exit', self._quit_app)
+            item('Exit', self._queue_quit)
         )
         
         # Create system tray icon
         self.icon = pystray.Icon(
             "QuestionAssistant",
-            image,
+            self._create_icon_image(),
             "Question Assistant",
             menu
         )
-        
-        # Run icon in separate thread
-        icon_thread = threading.Thread(target=self.icon.run, daemon=True)
-        icon_thread.start()
     
-    def _update_icon(self):
-        """Update tray icon based on status"""
-        if self.icon:
-            self.icon.icon = self._create_icon_image()
-            
-            # Update tooltip
-            if self.is_running:
-                self.icon.title = "Question Assistant - Running"
-            else:
-                self.icon.title = "Question Assistant - Idle"
-    
-    def _toggle_window(self, icon=None, item=None):
-        """Show or hide the main window"""
-        if self.window and self.window_visible:
-            self._hide_window()
-        else:
-            self._show_window()
-    
-    def _show_window(self):
-        """Show the main window"""
-        if not self.window:
-            # Create window if it doesn't exist
-            self.window = TrayMainWindow(self)
-            self.window.protocol("WM_DELETE_WINDOW", self._hide_window)
-        
-        # Show window
-        self.window.deiconify()
-        self.window.lift()
-        self.window.focus_force()
-        self.window_visible = True
-        self.logger.info("Window shown")
+    def _queue_show_window(self, icon=None, item=None):
+        """Queue show window command"""
+        self._enqueue(self._show_window)
     
-    def _hide_window(self):
-        """Hide the main window but keep app running"""
-        if self.window:
-            self.window.withdraw()
-            self.window_visible = False
-            self.logger.info("Window hidden - app still running in tray")
+    def _queue_hide_window(self, icon=None, item=None):
+        """Queue hide window command"""
+        self._enqueue(self._hide_window)
     
-    def _start_from_tray(self, icon=None, item=None):
-        """Start service from tray menu"""
-        if not self.is_running:
-            self.start_service()
+    def _queue_start_service(self, icon=None, item=None):
+        """Queue start service command"""
+        self._enqueue(self.start_service)
     
-    def _stop_from_tray(self, icon=None, item=None):
-        """Stop service from tray menu"""
-        if self.is_running:
-            self.stop_service()
+    def _queue_stop_service(self, icon=None, item=None):
+        """Queue stop service command"""
+        self._enqueue(self.stop_service)
+    
+    def _queue_show_config(self, icon=None, item=None):
+        """Queue show configuration page command"""
+        self._enqueue(self._show_config)
+    
+    def _queue_show_logs(self, icon=None, item=None):
+        """Queue show logs page command"""
+        self._enqueue(self._show_logs)
+    
+    def _queue_quit(self, icon=None, item=None):
+        """Queue quit command"""
+        self._enqueue(self._quit_app)
     
-    def _show_config(self, icon=None, item=None):
-        """Show configuration window"""
-        self._show_window()
+    def _show_window(self, take_focus=True):
+        """Show the main window"""
+        try:
+            if not self.window:
+                # Create window if it doesn't exist; CustomTkinter is
+                # only imported once the window is first needed
+                from src.gui_components.tray_window import TrayMainWindow
+                self.window = TrayMainWindow(self.root, self)
+                
+            # Show window; raising and focusing cost extra WM round-trips,
+            # so page navigation skips them
+            self.window.deiconify()
+            if take_focus:
+                self.window.lift()
+                self.window.focus_force()
+            self.window_visible = True
+            self.logger.info("Window shown")
+        except Exception as e:
+            self.logger.error(f"Error showing window: {e}")
+    
+    def _show_config(self):
+        """Show the window on its configuration page"""
+        self._show_window(take_focus=False)
         if self.window:
             self.window.show_config_page()
     
-    def _show_logs(self, icon=None, item=None):
-        """Show logs window"""
-        self._show_window()
+    def _show_logs(self):
+        """Show the window on its logs page"""
+        self._show_window(take_focus=False)
         if self.window:
             self.window.show_logs_page()
     
-    def start_service(self):
-        """Start the service"""
+    def _hide_window(self):
+        """Hide the main window but keep app running"""
         try:
-            if self.is_running:
-                return
-            
-            # Start service
-            self.service_manager = ServiceManager()
-            self.service_manager.config = self.config
-            
-            # Start in thread
-            thread = threading.Thread(target=self.service_manager.start)
-            thread.daemon = True
-            thread.start()
-            
-            self.is_running = True
-            self._update_icon()
-            
-            # Show notification
-            if self.icon:
-                self.icon.notify("Service Started", "Question Assistant is now running")
-            
-            self.logger.info("Service started from tray")
-            
-            # Update window if visible
             if self.window:
-                self.window.update_status(True)
-                
+                self.window.withdraw()
+                self.window_visible = False
+                self.logger.info("Window hidden - app still running in tray")
         except Exception as e:
-            self.logger.error(f"Error starting service: {e}")
-            if self.icon:
-                self.icon.notify("Error", f"Failed to start service: {str(e)}")
+            self.logger.error(f"Error hiding window: {e}")
     
-    def stop_service(self):
-        """Stop the service"""
-        try:
-            if not self.is_running:
-                return
-            
-            if self.service_manager:
-                self.service_manager.running = False
-                self.service_manager.stop()
-                self.service_manager = None
-            
+    def start_service(self):
+        """Start the service"""
+        with self._svc_lock:
+            try:
+                if self.is_running:
+                    return
+                
+                # Build the manager once and reuse it across start/stop toggles
+                if self.service_manager is None:
+                    self.service_manager = ServiceManager(ui_callback=self._on_service_event)
+                    self.service_manager.config = self.config
+                
+                # Counters restart with each session
+                for key in self.stats:
+                    self._apply_stat(key, 0)
+                
+                # Start on the service worker
+                future = self._svc_pool.submit(self.service_manager.start)
+                future.add_done_callback(self._svc_done)
+                
+                self.is_running = True
+                self._update_icon()
+                
+                self._notify("Service Started", "Question Assistant is now running")
+                self.logger.info("Service started")
+                
+                # Update window if visible
+                if self.window:
+                    self.window.update_status(True)
+                    
+            except Exception as e:
+                self.logger.error(f"Error starting service: {e}")
+                self._notify("Error", f"Failed to start service: {e}")
+    
+    def _svc_done(self, future):
+        """Report failures from the service worker (the pool would swallow them)"""
+        error = future.exception()
+        if error:
+            self.logger.error(f"Service worker failed: {error}")
+            self._enqueue(lambda: self._on_start_failed(error))
+    
+    def _on_start_failed(self, error):
+        """Roll back the running state after a failed start (Tk thread only)"""
+        with self._svc_lock:
             self.is_running = False
             self._update_icon()
             
-            # Show notification
-            if self.icon:
-                self.icon.notify("Service Stopped", "Question Assistant has stopped")
-            
-            self.logger.info("Service stopped from tray")
+            self._notify("Error", f"Failed to start service: {error}")
             
             # Update window if visible
             if self.window:
                 self.window.update_status(False)
+    
+    def stop_service(self):
+        """Stop the service"""
+        with self._svc_lock:
+            try:
+                if not self.is_running:
+                    return
                 
-        except Exception as e:
-            self.logger.error(f"Error stopping service: {e}")
+                if self.service_manager:
+                    self.service_manager.running = False
+                    self.service_manager.stop()
+                
+                self.is_running = False
+                self._update_icon()
+                
+                self._notify("Service Stopped", "Question Assistant has stopped")
+                self.logger.info("Service stopped")
+                
+                # Update window if visible
+                if self.window:
+                    self.window.update_status(False)
+                    
+            except Exception as e:
+                self.logger.error(f"Error stopping service: {e}")
+    
+    def _notify(self, title, message):
+        """Queue a tray notification; shown by the notify worker"""
+        self._notif_q.put((title, message))
+    
+    def _notify_worker(self):
+        """Show queued notifications, keeping the latest per title in each 500ms window"""
+        while True:
+            title, message = self._notif_q.get()
+            pending = {title: message}
+            while True:
+                try:
+                    title, message = self._notif_q.get(timeout=0.5)
+                except queue.Empty:
+                    break
+                pending.pop(title, None)
+                pending[title] = message
+            
+            for title, message in pending.items():
+                if self.icon:
+                    try:
+                        self.icon.notify(message, title)
+                    except Exception as e:
+                        self.logger.debug(f"Notification failed: {e}")
+    
+    def on_stats_update(self, callback):
+        """Register a callback that receives the stats dict on every change"""
+        self._stats_listeners.append(callback)
     
-    def _quit_app(self, icon=None, item=None):
+    def _on_service_event(self, kind, *payload):
+        """Service manager callback; runs on service threads"""
+        if kind == "stat":
+            key, value = payload
+            self._enqueue(lambda: self._apply_stat(key, value))
+    
+    def _apply_stat(self, key, value):
+        """Record a counter and notify subscribers (Tk thread only)"""
+        if key not in self.stats:
+            return
+        self.stats[key] = value
+        for callback in self._stats_listeners:
+            callback(self.stats)
+    
+    def reload_config(self):
+        """Re-read the configuration and hand it to the existing manager"""
+        self.config = Config()
+        if self.service_manager:
+            self.service_manager.config = self.config
+    
+    def _update_icon(self):
+        """Update tray icon based on status"""
+        if self.icon:
+            # Setting icon/title is a shell round-trip, so skip repeats
+            state = bool(self.is_running)
+            if state == self._last_icon_state:
+                return
+            self._last_icon_state = state
+            
+            self.icon.icon = self._create_icon_image(running=state)
+            self.icon.title = f"Question Assistant - {'Running' if state else 'Idle'}"
+    
+    def _quit_app(self):
         """Quit the application completely"""
         self.logger.info("Quitting application")
         
         # Stop service if running
         if self.is_running:
             self.stop_service()
+        self.service_manager = None
+        self._svc_pool.shutdown(wait=False)
         
         # Close window if open
         if self.window:
@@ -229,210 +367,33 @@ class TrayApplication:
         if self.icon:
             self.icon.stop()
         
+        # Quit root
+        if self.root:
+            self.root.quit()
+            self.root.destroy()
+        
         # Exit
         sys.exit(0)
     
     def run(self):
         """Run the application"""
-        # Start with window hidden
-        self.logger.info("Running in system tray mode")
+        # Create tray icon
+        self._create_tray_icon()
+        
+        # Run icon in separate thread
+        icon_thread = threading.Thread(target=self.icon.run, daemon=True)
+        icon_thread.start()
         
-        # Keep main thread alive
+        # Run GUI main loop in main thread. Tk must own the main thread, so
+        # mainloop() is the blocking wait here; it sleeps in the event loop
+        # until a command or Tk event arrives, like the earlier exit Event did
+        self.logger.info("Running in system tray mode")
         try:
-            while True:
-                time.sleep(1)
+            self.root.mainloop()
         except KeyboardInterrupt:
             self._quit_app()
 
 
-class TrayMainWindow(ctk.CTk):
-    """Minimal window for tray application"""
-    
-    def __init__(self, tray_app):
-        super().__init__()
-        
-        self.tray_app = tray_app
-        
-        # Window setup
-        self.title("Question Assistant")
-        self.geometry("600x400")
-        self.minsize(500, 350)
-        
-        # Colors
-        self.colors = {
-            "bg": "#1a1a1a",
-            "card": "#2d2d2d",
-            "accent": "#4a9eff",
-            "success": "#4caf50",
-            "error": "#f44336",
-            "text": "#ffffff",
-            "text_dim": "#888888"
-        }
-        
-        self.configure(fg_color=self.colors["bg"])
-        
-        # Create UI
-        self._create_ui()
-        
-        # Start hidden
-        self.withdraw()
-    
-    def _create_ui(self):
-        """Create minimal UI"""
-        # Header
-        header = ctk.CTkFrame(self, fg_color=self.colors["card"], height=50)
-        header.pack(fill="x", padx=10, pady=(10, 5))
-        header.pack_propagate(False)
-        
-        # Title and status
-        title_frame = ctk.CTkFrame(header, fg_color="transparent")
-        title_frame.pack(expand=True)
-        
-        title = ctk.CTkLabel(
-            title_frame,
-            text="Question Assistant",
-            font=("Arial", 16, "bold"),
-            text_color=self.colors["text"]
-        )
-        title.pack(side="left", padx=10)
-        
-        self.status_label = ctk.CTkLabel(
-            title_frame,
-            text="● Idle",
-            font=("Arial", 12),
-            text_color=self.colors["text_dim"]
-        )
-        self.status_label.pack(side="left", padx=20)
-        
-        # Control buttons
-        button_frame = ctk.CTkFrame(title_frame, fg_color="transparent")
-        button_frame.pack(side="right", padx=10)
-        
-        self.start_btn = ctk.CTkButton(
-            button_frame,
-            text="Start",
-            width=70,
-            height=30,
-            command=self.tray_app.start_service,
-            fg_color=self.colors["success"]
-        )
-        self.start_btn.pack(side="left", padx=5)
-        
-        self.stop_btn = ctk.CTkButton(
-            button_frame,
-            text="Stop",
-            width=70,
-            height=30,
-            command=self.tray_app.stop_service,
-            fg_color=self.colors["error"],
-            state="disabled"
-        )
-        self.stop_btn.pack(side="left", padx=5)
-        
-        # Content area
-        self.content = ctk.CTkFrame(self, fg_color=self.colors["card"])
-        self.content.pack(fill="both", expand=True, padx=10, pady=5)
-        
-        # Info text
-        info = ctk.CTkLabel(
-            self.content,
-            text="Question Assistant is running in the system tray.\n\nYou can close this window and the app will continue running.\nAccess controls from the system tray icon.",
-            font=("Arial", 12),
-            text_color=self.colors["text_dim"],
-            justify="center"
-        )
-        info.pack(expand=True)
-        
-        # Bottom info
-        bottom = ctk.CTkFrame(self, fg_color=self.colors["card"], height=30)
-        bottom.pack(fill="x", padx=10, pady=(5, 10))
-        
-        info_label = ctk.CTkLabel(
-            bottom,
-            text="💡 Tip: Press ESC to quickly hide this window",
-            font=("Arial", 10),
-            text_color=self.colors["text_dim"]
-        )
-        info_label.pack(pady=5)
-        
-        # Keyboard shortcuts
-        self.bind("<Escape>", lambda e: self.tray_app._hide_window())
-        self.bind("<Control-s>", lambda e: self.tray_app.start_service())
-        self.bind("<Control-x>", lambda e: self.tray_app.stop_service())
-    
-    def update_status(self, is_running):
-        """Update status display"""
-        if is_running:
-            self.status_label.configure(
-                text="● Running",
-                text_color=self.colors["success"]
-            )
-            self.start_btn.configure(state="disabled")
-            self.stop_btn.configure(state="normal")
-        else:
-            self.status_label.configure(
-                text="● Idle",
-                text_color=self.colors["text_dim"]
-            )
-            self.start_btn.configure(state="normal")
-            self.stop_btn.configure(state="disabled")
-    
-    def show_config_page(self):
-        """Show configuration page"""
-        # Clear content
-        for widget in self.content.winfo_children():
-            widget.destroy()
-        
-        # Add config UI
-        config_label = ctk.CTkLabel(
-            self.content,
-            text="Configuration",
-            font=("Arial", 14, "bold"),
-            text_color=self.colors["text"]
-        )
-        config_label.pack(pady=10)
-        
-        # Add basic config options
-        context_label = ctk.CTkLabel(
-            self.content,
-            text="Context:",
-            font=("Arial", 11),
-            text_color=self.colors["text_dim"]
-        )
-        context_label.pack(pady=(10, 5))
-        
-        context_entry = ctk.CTkEntry(
-            self.content,
-            placeholder_text="e.g., Mathematics",
-            width=300
-        )
-        context_entry.pack()
-    
-    def show_logs_page(self):
-        """Show logs page"""
-        # Clear content
-        for widget in self.content.winfo_children():
-            widget.destroy()
-        
-        # Add logs UI
-        logs_label = ctk.CTkLabel(
-            self.content,
-            text="Activity Logs",
-            font=("Arial", 14, "bold"),
-            text_color=self.colors["text"]
-        )
-        logs_label.pack(pady=10)
-        
-        # Log text area
-        log_text = ctk.CTkTextbox(
-            self.content,
-            fg_color=self.colors["bg"],
-            text_color=self.colors["text_dim"]
-        )
-        log_text.pack(fill="both", expand=True, padx=20, pady=10)
-        log_text.insert("1.0", "Application logs will appear here...")
-
-
 if __name__ == "__main__":
     app = TrayApplication()
     app.run()
\ No newline at end of file
@@ -0,0 +1,280 @@
+"""Main window for the system tray application"""
+import tkinter as tk
+import customtkinter as ctk
+
+
+class _Palette:
+    """Tray window colors, shared by every window"""
+    __slots__ = ("bg", "card", "accent", "success", "error", "text", "text_dim")
+    
+    def __init__(self, **colors):
+        for name, value in colors.items():
+            setattr(self, name, value)
+
+
+_PALETTE = _Palette(
+    bg="#1a1a1a",
+    card="#2d2d2d",
+    accent="#4a9eff",
+    success="#4caf50",
+    error="#f44336",
+    text="#ffffff",
+    text_dim="#888888"
+)
+
+
+class TrayMainWindow(ctk.CTkToplevel):
+    """Minimal window for tray application"""
+    
+    STATS_TEMPLATE = "Questions Detected: %d\nQuestions Answered: %d"
+    
+    def __init__(self, parent, tray_app):
+        super().__init__(parent)
+        
+        self.tray_app = tray_app
+        
+        # Window setup
+        self.title("Question Assistant")
+        self.geometry("600x400")
+        self.minsize(500, 350)
+        
+        # Handle window close
+        self.protocol("WM_DELETE_WINDOW", self.hide_window)
+        
+        # Colors
+        self.colors = _PALETTE
+        
+        # Configure appearance
+        ctk.set_appearance_mode("dark")
+        self.configure(fg_color=self.colors.bg)
+        
+        # Create UI
+        self._create_ui()
+        self.tray_app.on_stats_update(self.update_stats)
+        
+        # Start hidden
+        self.withdraw()
+    
+    def hide_window(self):
+        """Hide window instead of destroying"""
+        self.withdraw()
+        self.tray_app.window_visible = False
+    
+    def _create_ui(self):
+        """Create minimal UI"""
+        # Main container
+        main_frame = ctk.CTkFrame(self, fg_color=self.colors.bg)
+        main_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Header
+        header = ctk.CTkFrame(main_frame, fg_color=self.colors.card, height=60, corner_radius=10)
+        header.pack(fill="x", pady=(0, 10))
+        header.pack_propagate(False)
+        
+        # Title and status
+        header_content = ctk.CTkFrame(header, fg_color="transparent")
+        header_content.pack(expand=True)
+        
+        title = ctk.CTkLabel(
+            header_content,
+            text="Question Assistant",
+            font=("Arial", 18, "bold"),
+            text_color=self.colors.text
+        )
+        title.pack(side="left", padx=20)
+        
+        self.status_label = ctk.CTkLabel(
+            header_content,
+            text="● Idle",
+            font=("Arial", 14),
+            text_color=self.colors.text_dim
+        )
+        self.status_label.pack(side="left", padx=20)
+        
+        # Control buttons
+        button_frame = ctk.CTkFrame(header_content, fg_color="transparent")
+        button_frame.pack(side="right", padx=20)
+        
+        self.start_btn = ctk.CTkButton(
+            button_frame,
+            text="Start",
+            width=80,
+            height=35,
+            command=self.tray_app.start_service,
+            fg_color=self.colors.success,
+            hover_color="#45a049"
+        )
+        self.start_btn.pack(side="left", padx=5)
+        
+        self.stop_btn = ctk.CTkButton(
+            button_frame,
+            text="Stop",
+            width=80,
+            height=35,
+            command=self.tray_app.stop_service,
+            fg_color=self.colors.error,
+            hover_color="#da190b",
+            state="disabled"
+        )
+        self.stop_btn.pack(side="left", padx=5)
+        
+        # Content area
+        content = ctk.CTkFrame(main_frame, fg_color=self.colors.card, corner_radius=10)
+        content.pack(fill="both", expand=True, pady=(0, 10))
+        
+        # Pages are built once and swapped with pack_forget
+        self._info_page = ctk.CTkFrame(content, fg_color="transparent")
+        self._info_page.pack(fill="both", expand=True)
+        self._current_page = self._info_page
+        self._config_page = self._create_config_page(content)
+        self._logs_page = self._create_logs_page(content)
+        
+        # Info text
+        info_frame = ctk.CTkFrame(self._info_page, fg_color="transparent")
+        info_frame.pack(expand=True)
+        
+        info = ctk.CTkLabel(
+            info_frame,
+            text="Question Assistant is running in the system tray",
+            font=("Arial", 16),
+            text_color=self.colors.text
+        )
+        info.pack(pady=(20, 10))
+        
+        info2 = ctk.CTkLabel(
+            info_frame,
+            text="You can safely close this window.\nThe app will continue running in the background.",
+            font=("Arial", 12),
+            text_color=self.colors.text_dim,
+            justify="center"
+        )
+        info2.pack(pady=10)
+        
+        # Quick stats
+        stats_frame = ctk.CTkFrame(self._info_page, fg_color=self.colors.bg, corner_radius=8)
+        stats_frame.pack(pady=20, padx=40, fill="x")
+        
+        self.stats_var = tk.StringVar(master=self, value=self._format_stats(self.tray_app.stats))
+        self.stats_label = ctk.CTkLabel(
+            stats_frame,
+            textvariable=self.stats_var,
+            font=("Arial", 11),
+            text_color=self.colors.text_dim,
+            justify="left"
+        )
+        self.stats_label.pack(pady=15, padx=20)
+        
+        # Bottom info
+        bottom = ctk.CTkFrame(main_frame, fg_color=self.colors.card, height=40, corner_radius=10)
+        bottom.pack(fill="x")
+        bottom.pack_propagate(False)
+        
+        tip_label = ctk.CTkLabel(
+            bottom,
+            text="💡 Tip: Right-click the tray icon for more options",
+            font=("Arial", 11),
+            text_color=self.colors.text_dim
+        )
+        tip_label.pack(expand=True)
+        
+        # Keyboard shortcuts
+        self.bind("<Escape>", lambda e: self.hide_window())
+        self.bind("<Control-s>", lambda e: self.tray_app.start_service())
+        self.bind("<Control-x>", lambda e: self.tray_app.stop_service())
+    
+    def _create_config_page(self, parent):
+        """Build the (initially hidden) configuration page"""
+        page = ctk.CTkFrame(parent, fg_color="transparent")
+        
+        config_label = ctk.CTkLabel(
+            page,
+            text="Configuration",
+            font=("Arial", 14, "bold"),
+            text_color=self.colors.text
+        )
+        config_label.pack(pady=10)
+        
+        context_label = ctk.CTkLabel(
+            page,
+            text="Context:",
+            font=("Arial", 11),
+            text_color=self.colors.text_dim
+        )
+        context_label.pack(pady=(10, 5))
+        
+        self.context_entry = ctk.CTkEntry(
+            page,
+            placeholder_text="e.g., Mathematics",
+            width=300
+        )
+        self.context_entry.pack()
+        
+        return page
+    
+    def _create_logs_page(self, parent):
+        """Build the (initially hidden) logs page"""
+        page = ctk.CTkFrame(parent, fg_color="transparent")
+        
+        logs_label = ctk.CTkLabel(
+            page,
+            text="Activity Logs",
+            font=("Arial", 14, "bold"),
+            text_color=self.colors.text
+        )
+        logs_label.pack(pady=10)
+        
+        self.log_text = ctk.CTkTextbox(
+            page,
+            fg_color=self.colors.bg,
+            text_color=self.colors.text_dim
+        )
+        self.log_text.pack(fill="both", expand=True, padx=20, pady=10)
+        self.log_text.insert("1.0", "Application logs will appear here...")
+        
+        return page
+    
+    def _show_page(self, page):
+        """Swap the visible content page"""
+        if page is self._current_page:
+            return
+        self._current_page.pack_forget()
+        page.pack(fill="both", expand=True)
+        self._current_page = page
+    
+    def show_info_page(self):
+        """Show the default info page"""
+        self._show_page(self._info_page)
+    
+    def show_config_page(self):
+        """Show configuration page"""
+        self._show_page(self._config_page)
+    
+    def show_logs_page(self):
+        """Show logs page"""
+        self._show_page(self._logs_page)
+    
+    def update_status(self, is_running):
+        """Update status display"""
+        if is_running:
+            self.status_label.configure(
+                text="● Running",
+                text_color=self.colors.success
+            )
+            self.start_btn.configure(state="disabled")
+            self.stop_btn.configure(state="normal")
+        else:
+            self.status_label.configure(
+                text="● Idle",
+                text_color=self.colors.text_dim
+            )
+            self.start_btn.configure(state="normal")
+            self.stop_btn.configure(state="disabled")
+    
+    def _format_stats(self, stats):
+        """Render the stats dict with the label template"""
+        return self.STATS_TEMPLATE % (stats["questions_detected"], stats["questions_answered"])
+    
+    def update_stats(self, stats):
+        """Publish new counters to the stats label"""
+        self.stats_var.set(self._format_stats(stats))
+
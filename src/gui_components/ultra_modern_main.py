@@ -1,12 +1,15 @@
 """Ultra-modern GUI with cutting-edge design and animations"""
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import ttk, messagebox
 import customtkinter as ctk
 import sys
 import tempfile
 from pathlib import Path
 import threading
-import time
+import itertools
+import logging
+from collections import deque
+from functools import partial, lru_cache
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
@@ -24,16 +27,72 @@ from src.gui_components.custom_widgets import (
     NotificationToast
 )
 from src.gui_components.system_tray import SystemTray
-from src.utils.logger import get_logger
+from src.utils.logger import get_logger, Logger
 
 # Set CustomTkinter appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Activity levels the dashboard bar steps through while the service runs
+_ACTIVITY_CYCLE = itertools.cycle((60, 70, 80, 90, 80, 70))
+
+@lru_cache(maxsize=16)
+def _font(style):
+    """Theme font for a style name, resolved once per style"""
+    return theme_manager.get_font(style)
+
+
+# Sidebar navigation: (icon, label, page id)
+_NAV_ITEMS = (
+    ("🏠", "Dashboard", "dashboard"),
+    ("⚙️", "Configuration", "config"),
+    ("📊", "Analytics", "analytics"),
+    ("🔬", "Advanced", "advanced"),
+    ("📝", "Logs", "logs"),
+    ("ℹ️", "About", "about")
+)
+
+# Advanced page feature toggles: (label, enabled by default)
+_FEATURES = (
+    ("🚀 Hardware Acceleration", True),
+    ("🧠 AI Enhancement", True),
+    ("🔄 Auto-retry Failed Detections", False),
+    ("📸 Screenshot Optimization", True),
+    ("🎯 Smart Targeting", True),
+    ("💾 Local Caching", False)
+)
+
+# Analytics page metrics: (label, percent, theme color key)
+_METRICS = (
+    ("CPU Usage", 25, "success"),
+    ("Memory Usage", 45, "warning"),
+    ("Network Activity", 10, "accent"),
+    ("Detection Accuracy", 85, "success")
+)
+
+
+class _BufferHandler(logging.Handler):
+    """Logging handler that appends formatted records to a deque"""
+    
+    def __init__(self, buffer):
+        super().__init__()
+        self.buffer = buffer
+        self.setFormatter(logging.Formatter(
+            '%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S'
+        ))
+    
+    def emit(self, record):
+        try:
+            self.buffer.append(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
 
 class UltraModernAssistant(ctk.CTk):
     """Ultra-modern question assistant with cutting-edge UI"""
     
+    LOG_MAX_LINES = 2000
+    
     def __init__(self):
         super().__init__()
         
@@ -41,6 +100,23 @@ class UltraModernAssistant(ctk.CTk):
         self.geometry("1200x700")
         self.minsize(1000, 600)
         
+        # Shared fonts for styles used by several widgets
+        self.f_title = ctk.CTkFont(family="Segoe UI Bold", size=32)
+        self.f_value = ctk.CTkFont(family="Segoe UI Bold", size=24)
+        self.f_h2 = ctk.CTkFont(family="Segoe UI Bold", size=18)
+        self.f_label = ctk.CTkFont(family="Segoe UI Bold", size=14)
+        self.f_icon = ctk.CTkFont(family="Segoe UI", size=32)
+        self.f_body_lg = ctk.CTkFont(family="Segoe UI", size=14)
+        self.f_body = ctk.CTkFont(family="Segoe UI", size=12)
+        self.f_status = ctk.CTkFont(family="Segoe UI", size=11)
+        self.f_mono = ctk.CTkFont(family="Consolas", size=11)
+        self.f_logo = ctk.CTkFont(family="Segoe UI", size=36)
+        self.f_brand = ctk.CTkFont(family="Segoe UI Bold", size=16)
+        self.f_metric = ctk.CTkFont(family="Segoe UI Bold", size=12)
+        self.f_hero_icon = ctk.CTkFont(family="Segoe UI", size=72)
+        self.f_hero = ctk.CTkFont(family="Segoe UI Bold", size=28)
+        self.f_small = ctk.CTkFont(family="Segoe UI", size=10)
+        
         # Full opacity - no transparency
         self.attributes("-alpha", 1.0)
         
@@ -49,12 +125,31 @@ class UltraModernAssistant(ctk.CTk):
         self.service_manager = None
         self.logger = get_logger("GUI")
         self.system_tray = None
+        self._dur_after = None
+        self._starting = False
+        self._toast = None
+        
+        # Recurring timers, cancelled on close
+        self._after_ids = set()
+        
+        # Log records from any thread land in a bounded buffer; a 200ms
+        # tick moves them into the log viewer in one insert
+        self._log_buf = deque(maxlen=self.LOG_MAX_LINES)
+        self._log_handler = _BufferHandler(self._log_buf)
+        Logger.get_logger().addHandler(self._log_handler)
+        self.log_viewer = None
         
         # Theme
         self.current_theme = "dark"
-        theme = theme_manager.get_theme(self.current_theme)
-        self.configure(fg_color=theme["bg"])
-        
+        # Looked up once; page builders read this instead of theme_manager
+        self._theme = theme_manager.get_theme(self.current_theme)
+        theme_manager.subscribe(self._on_theme_changed)
+        self.configure(fg_color=self._theme["bg"])
+
+        # The native vista/xpnative ttk themes ignore background and
+        # troughcolor, so the colored progress bar styles need clam
+        ttk.Style(self).theme_use("clam")
+
         # Create modern UI
         self._create_modern_ui()
         
@@ -72,10 +167,11 @@ class UltraModernAssistant(ctk.CTk):
         
         # Start background animations
         self._start_background_animations()
+        self._schedule(200, self._flush_logs)
     
     def _create_modern_ui(self):
         """Create ultra-modern UI layout"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         
         # Main container with gradient background
         self.main_container = GradientFrame(
@@ -108,7 +204,7 @@ class UltraModernAssistant(ctk.CTk):
     
     def _create_animated_sidebar(self):
         """Create animated collapsible sidebar"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         
         # Use animated sidebar widget - narrower
         self.sidebar = AnimatedSidebar(
@@ -125,7 +221,7 @@ class UltraModernAssistant(ctk.CTk):
         self.logo_label = ctk.CTkLabel(
             logo_container,
             text="🚀",
-            font=("Segoe UI", 36)
+            font=self.f_logo
         )
         self.logo_label.pack()
         self._animate_logo()
@@ -134,7 +230,7 @@ class UltraModernAssistant(ctk.CTk):
         self.title_label = ctk.CTkLabel(
             logo_container,
             text="Question Assistant",
-            font=("Segoe UI Bold", 16),
+            font=self.f_brand,
             text_color=theme["accent"]
         )
         self.title_label.pack(pady=(5, 0))
@@ -153,24 +249,14 @@ class UltraModernAssistant(ctk.CTk):
     
     def _create_nav_items(self):
         """Create navigation items with modern styling"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         
         nav_container = ctk.CTkFrame(self.sidebar, fg_color="transparent")
         nav_container.pack(fill="both", expand=True, padx=20)
         
-        # Navigation items with icons
-        nav_items = [
-            ("🏠", "Dashboard", "dashboard"),
-            ("⚙️", "Configuration", "config"),
-            ("📊", "Analytics", "analytics"),
-            ("🔬", "Advanced", "advanced"),
-            ("📝", "Logs", "logs"),
-            ("ℹ️", "About", "about")
-        ]
-        
         self.nav_buttons = {}
         
-        for icon, text, page_id in nav_items:
+        for icon, text, page_id in _NAV_ITEMS:
             btn_frame = ctk.CTkFrame(nav_container, fg_color="transparent")
             btn_frame.pack(fill="x", pady=3)
             
@@ -196,7 +282,7 @@ class UltraModernAssistant(ctk.CTk):
         theme_label = ctk.CTkLabel(
             theme_container,
             text="🌓 Dark Mode",
-            font=theme_manager.get_font("small")
+            font=_font("small")
         )
         theme_label.pack(side="left")
         
@@ -210,7 +296,7 @@ class UltraModernAssistant(ctk.CTk):
     
     def _create_modern_header(self):
         """Create minimal header with controls only"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         
         # Minimal header frame - 10% of window
         self.header = ctk.CTkFrame(self.content_area, fg_color=theme["bg_secondary"], height=50)
@@ -267,43 +353,44 @@ class UltraModernAssistant(ctk.CTk):
         )
         self.content_frame.pack(fill="both", expand=True, padx=10, pady=2)
         
-        # Create pages
+        # Pages share one grid cell; switching just raises the chosen one
+        self.content_frame.grid_rowconfigure(0, weight=1)
+        self.content_frame.grid_columnconfigure(0, weight=1)
+        
+        # Pages are built on first visit; only the dashboard exists up front
         self.pages = {}
-        self._create_pages()
+        self._active_page = None
+        self._page_factories = {
+            "dashboard": self._create_dashboard_page,
+            "config": self._create_config_page,
+            "analytics": self._create_analytics_page,
+            "advanced": self._create_advanced_page,
+            "logs": self._create_logs_page,
+            "about": self._create_about_page
+        }
         
         # Show dashboard by default
         self._show_page("dashboard")
     
-    def _create_pages(self):
-        """Create content pages with modern design"""
-        # Dashboard page with cards
-        self.pages["dashboard"] = self._create_dashboard_page()
-        
-        # Configuration page
-        self.pages["config"] = self._create_config_page()
-        
-        # Analytics page
-        self.pages["analytics"] = self._create_analytics_page()
-        
-        # Advanced settings
-        self.pages["advanced"] = self._create_advanced_page()
-        
-        # Logs page
-        self.pages["logs"] = self._create_logs_page()
-        
-        # About page
-        self.pages["about"] = self._create_about_page()
+    def _get_page(self, page_id):
+        """Return a page, building it the first time it is needed"""
+        page = self.pages.get(page_id)
+        if page is None and page_id in self._page_factories:
+            # Built pages stay unmapped until _show_page grids them
+            page = self.pages[page_id] = self._page_factories[page_id]()
+        return page
     
     def _create_dashboard_page(self):
         """Create modern dashboard with cards"""
+        theme = self._theme
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         
         # Title with animation
         title = ctk.CTkLabel(
             page,
             text="Dashboard",
-            font=("Segoe UI Bold", 32),
-            text_color=theme_manager.get_theme()["fg"]
+            font=self.f_title,
+            text_color=theme["fg"]
         )
         title.pack(anchor="w", pady=(0, 20))
         
@@ -324,7 +411,7 @@ class UltraModernAssistant(ctk.CTk):
         graph_title = ctk.CTkLabel(
             graph_card,
             text="📈 Activity Monitor",
-            font=("Segoe UI Bold", 18)
+            font=self.f_h2
         )
         graph_title.pack(anchor="w", padx=20, pady=(15, 10))
         
@@ -340,6 +427,7 @@ class UltraModernAssistant(ctk.CTk):
     
     def _create_stat_card(self, parent, icon, title, value, row, col):
         """Create a statistics card"""
+        theme = self._theme
         card = GlassmorphicCard(parent)
         card.grid(row=row, column=col, padx=10, pady=10, sticky="ew")
         
@@ -350,7 +438,7 @@ class UltraModernAssistant(ctk.CTk):
         icon_label = ctk.CTkLabel(
             card,
             text=icon,
-            font=("Segoe UI", 32)
+            font=self.f_icon
         )
         icon_label.pack(pady=(15, 5))
         
@@ -358,8 +446,8 @@ class UltraModernAssistant(ctk.CTk):
         value_label = ctk.CTkLabel(
             card,
             text=value,
-            font=("Segoe UI Bold", 24),
-            text_color=theme_manager.get_theme()["accent"]
+            font=self.f_value,
+            text_color=theme["accent"]
         )
         value_label.pack()
         
@@ -367,8 +455,8 @@ class UltraModernAssistant(ctk.CTk):
         title_label = ctk.CTkLabel(
             card,
             text=title,
-            font=("Segoe UI", 12),
-            text_color=theme_manager.get_theme()["fg_secondary"]
+            font=self.f_body,
+            text_color=theme["fg_secondary"]
         )
         title_label.pack(pady=(5, 15))
         
@@ -376,13 +464,13 @@ class UltraModernAssistant(ctk.CTk):
     
     def _create_config_page(self):
         """Create configuration page with modern inputs"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         
         title = ctk.CTkLabel(
             page,
             text="Configuration",
-            font=("Segoe UI Bold", 32),
+            font=self.f_title,
             text_color=theme["fg"]
         )
         title.pack(anchor="w", pady=(0, 20))
@@ -395,7 +483,7 @@ class UltraModernAssistant(ctk.CTk):
         context_label = ctk.CTkLabel(
             settings_card,
             text="📝 Question Context",
-            font=("Segoe UI Bold", 14),
+            font=self.f_label,
             text_color=theme["fg"]
         )
         context_label.pack(anchor="w", padx=20, pady=(15, 5))
@@ -405,7 +493,7 @@ class UltraModernAssistant(ctk.CTk):
             height=100,
             fg_color=theme["bg_tertiary"],
             text_color=theme["fg"],
-            font=theme_manager.get_font("body"),
+            font=_font("body"),
             corner_radius=10
         )
         self.context_entry.pack(fill="x", padx=20, pady=(0, 15))
@@ -417,14 +505,14 @@ class UltraModernAssistant(ctk.CTk):
         ctk.CTkLabel(
             duration_frame,
             text="⏰ Session Duration",
-            font=("Segoe UI Bold", 14),
+            font=self.f_label,
             text_color=theme["fg"]
         ).pack(side="left")
         
         self.duration_value = ctk.CTkLabel(
             duration_frame,
             text="60 min",
-            font=("Segoe UI", 14),
+            font=self.f_body_lg,
             text_color=theme["accent"]
         )
         self.duration_value.pack(side="right")
@@ -449,7 +537,7 @@ class UltraModernAssistant(ctk.CTk):
         api_label = ctk.CTkLabel(
             api_card,
             text="🔐 API Configuration",
-            font=("Segoe UI Bold", 14),
+            font=self.f_label,
             text_color=theme["fg"]
         )
         api_label.pack(anchor="w", padx=20, pady=(15, 10))
@@ -465,13 +553,13 @@ class UltraModernAssistant(ctk.CTk):
     
     def _create_analytics_page(self):
         """Create analytics page with charts"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         
         title = ctk.CTkLabel(
             page,
             text="Analytics",
-            font=("Segoe UI Bold", 32),
+            font=self.f_title,
             text_color=theme["fg"]
         )
         title.pack(anchor="w", pady=(0, 20))
@@ -483,54 +571,58 @@ class UltraModernAssistant(ctk.CTk):
         metrics_title = ctk.CTkLabel(
             metrics_card,
             text="📊 Performance Metrics",
-            font=("Segoe UI Bold", 18)
+            font=self.f_h2
         )
         metrics_title.pack(anchor="w", padx=20, pady=15)
         
-        # Add animated progress bars for different metrics
-        metrics = [
-            ("CPU Usage", 25, theme["success"]),
-            ("Memory Usage", 45, theme["warning"]),
-            ("Network Activity", 10, theme["accent"]),
-            ("Detection Accuracy", 85, theme["success"])
-        ]
+        # Native ttk progress bars; one style per theme color
+        style = ttk.Style(self)
+        for color_key in {key for _, _, key in _METRICS}:
+            style.configure(
+                f"{color_key}.Horizontal.TProgressbar",
+                background=theme[color_key],
+                troughcolor=theme["bg_tertiary"],
+                borderwidth=0,
+                thickness=6
+            )
         
-        for metric_name, value, color in metrics:
+        for metric_name, value, color_key in _METRICS:
             metric_frame = ctk.CTkFrame(metrics_card, fg_color="transparent")
             metric_frame.pack(fill="x", padx=20, pady=5)
             
             ctk.CTkLabel(
                 metric_frame,
                 text=metric_name,
-                font=("Segoe UI", 12)
+                font=self.f_body
             ).pack(side="left")
             
             ctk.CTkLabel(
                 metric_frame,
                 text=f"{value}%",
-                font=("Segoe UI Bold", 12),
-                text_color=color
+                font=self.f_metric,
+                text_color=theme[color_key]
             ).pack(side="right")
             
-            progress = AnimatedProgressBar(
+            progress = ttk.Progressbar(
                 metrics_card,
-                height=6,
-                width=400
+                style=f"{color_key}.Horizontal.TProgressbar",
+                length=400,
+                maximum=100,
+                value=value
             )
             progress.pack(padx=20, pady=(0, 10))
-            progress.set_progress(value)
         
         return page
     
     def _create_advanced_page(self):
         """Create advanced settings page"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         
         title = ctk.CTkLabel(
             page,
             text="Advanced Settings",
-            font=("Segoe UI Bold", 32),
+            font=self.f_title,
             text_color=theme["fg"]
         )
         title.pack(anchor="w", pady=(0, 20))
@@ -542,43 +634,38 @@ class UltraModernAssistant(ctk.CTk):
         features_title = ctk.CTkLabel(
             features_card,
             text="🔧 Feature Toggles",
-            font=("Segoe UI Bold", 18)
+            font=self.f_h2
         )
         features_title.pack(anchor="w", padx=20, pady=15)
         
-        features = [
-            ("🚀 Hardware Acceleration", True),
-            ("🧠 AI Enhancement", True),
-            ("🔄 Auto-retry Failed Detections", False),
-            ("📸 Screenshot Optimization", True),
-            ("🎯 Smart Targeting", True),
-            ("💾 Local Caching", False)
-        ]
-        
-        for feature_name, default in features:
+        self.feature_switches = {}
+        self.feature_states = {}
+        for feature_name, default in _FEATURES:
             feature_frame = ctk.CTkFrame(features_card, fg_color="transparent")
             feature_frame.pack(fill="x", padx=20, pady=8)
             
             ctk.CTkLabel(
                 feature_frame,
                 text=feature_name,
-                font=("Segoe UI", 14)
+                font=self.f_body_lg
             ).pack(side="left")
             
             switch = ModernSwitch(
                 feature_frame,
                 text="",
-                command=lambda: None
+                command=partial(self._on_feature_toggle, feature_name)
             )
             switch.pack(side="right", padx=10)
             if default:
                 switch.select()
+            self.feature_switches[feature_name] = switch
+            self.feature_states[feature_name] = default
         
         return page
     
     def _create_logs_page(self):
         """Create logs page"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         
         # Header with controls
@@ -588,7 +675,7 @@ class UltraModernAssistant(ctk.CTk):
         title = ctk.CTkLabel(
             header_frame,
             text="Logs",
-            font=("Segoe UI Bold", 32),
+            font=self.f_title,
             text_color=theme["fg"]
         )
         title.pack(side="left")
@@ -615,20 +702,30 @@ class UltraModernAssistant(ctk.CTk):
         log_card = GlassmorphicCard(page)
         log_card.pack(fill="both", expand=True)
         
-        self.log_viewer = ctk.CTkTextbox(
-            log_card,
-            fg_color=theme["bg_tertiary"],
-            text_color=theme["fg"],
-            font=("Consolas", 11),
-            corner_radius=10
+        # Native Text widget: inserts and scrolling skip CTk's canvas redraws
+        log_container = ttk.Frame(log_card)
+        log_container.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        self.log_viewer = tk.Text(
+            log_container,
+            bg=theme["bg_tertiary"],
+            fg=theme["fg"],
+            insertbackground=theme["fg"],
+            font=self.f_mono,
+            relief="flat",
+            borderwidth=0,
+            wrap="word"
         )
-        self.log_viewer.pack(fill="both", expand=True, padx=20, pady=20)
+        scrollbar = ttk.Scrollbar(log_container, orient="vertical", command=self.log_viewer.yview)
+        scrollbar.pack(side="right", fill="y")
+        self.log_viewer.configure(yscrollcommand=scrollbar.set)
+        self.log_viewer.pack(side="left", fill="both", expand=True)
         
         return page
     
     def _create_about_page(self):
         """Create about page"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         page = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         
         # Center content
@@ -639,7 +736,7 @@ class UltraModernAssistant(ctk.CTk):
         logo = ctk.CTkLabel(
             about_card,
             text="🚀",
-            font=("Segoe UI", 72)
+            font=self.f_hero_icon
         )
         logo.pack(pady=20)
         
@@ -647,7 +744,7 @@ class UltraModernAssistant(ctk.CTk):
         title = ctk.CTkLabel(
             about_card,
             text="Question Assistant Pro",
-            font=("Segoe UI Bold", 28),
+            font=self.f_hero,
             text_color=theme["accent"]
         )
         title.pack()
@@ -656,7 +753,7 @@ class UltraModernAssistant(ctk.CTk):
         version = ctk.CTkLabel(
             about_card,
             text="Version 3.0.0",
-            font=("Segoe UI", 14),
+            font=self.f_body_lg,
             text_color=theme["fg_secondary"]
         )
         version.pack(pady=5)
@@ -665,7 +762,7 @@ class UltraModernAssistant(ctk.CTk):
         desc = ctk.CTkLabel(
             about_card,
             text="Next-generation automated assistant\nwith AI-powered intelligence",
-            font=("Segoe UI", 12),
+            font=self.f_body,
             text_color=theme["fg_secondary"],
             justify="center"
         )
@@ -693,7 +790,7 @@ class UltraModernAssistant(ctk.CTk):
         copyright_label = ctk.CTkLabel(
             about_card,
             text="© 2024 Question Assistant. All rights reserved.",
-            font=("Segoe UI", 10),
+            font=self.f_small,
             text_color=theme["fg_secondary"]
         )
         copyright_label.pack(pady=(20, 30))
@@ -712,7 +809,7 @@ class UltraModernAssistant(ctk.CTk):
     
     def _create_status_bar(self):
         """Create modern status bar"""
-        theme = theme_manager.get_theme()
+        theme = self._theme
         
         self.status_bar = ctk.CTkFrame(
             self,
@@ -725,7 +822,7 @@ class UltraModernAssistant(ctk.CTk):
         self.status_text = ctk.CTkLabel(
             self.status_bar,
             text="🟢 Ready",
-            font=("Segoe UI", 11)
+            font=self.f_status
         )
         self.status_text.pack(side="left", padx=10)
         
@@ -733,29 +830,33 @@ class UltraModernAssistant(ctk.CTk):
         self.connection_indicator = ctk.CTkLabel(
             self.status_bar,
             text="🌐 Connected",
-            font=("Segoe UI", 11),
+            font=self.f_status,
             text_color=theme["success"]
         )
         self.connection_indicator.pack(side="right", padx=10)
     
     def _show_page(self, page_id):
         """Show specific page with animation"""
-        # Hide all pages
-        for page in self.pages.values():
-            page.pack_forget()
-        
-        # Show selected page with fade animation
-        if page_id in self.pages:
-            self.pages[page_id].pack(fill="both", expand=True)
-            self._fade_in_page(self.pages[page_id])
-        
-        # Update nav button states
-        theme = theme_manager.get_theme()
-        for btn_id, btn in self.nav_buttons.items():
-            if btn_id == page_id:
-                btn.configure(fg_color=theme["accent"])
-            else:
-                btn.configure(fg_color=theme["bg_secondary"])
+        if self._active_page == page_id:
+            return
+
+        # Only the visible page is gridded, so the scrollable content
+        # area sizes to it rather than to the tallest page built so far
+        page = self._get_page(page_id)
+        if page is not None:
+            previous = self.pages.get(self._active_page)
+            if previous is not None:
+                previous.grid_remove()
+            page.grid(row=0, column=0, sticky="nsew")
+            self._fade_in_page(page)
+        
+        # Restyle only the nav buttons whose state changes
+        theme = self._theme
+        if self._active_page in self.nav_buttons:
+            self.nav_buttons[self._active_page].configure(fg_color=theme["bg_secondary"])
+        if page_id in self.nav_buttons:
+            self.nav_buttons[page_id].configure(fg_color=theme["accent"])
+        self._active_page = page_id
     
     def _fade_in_page(self, page):
         """Fade in animation for page"""
@@ -765,62 +866,112 @@ class UltraModernAssistant(ctk.CTk):
     
     def _animate_logo(self):
         """Animate logo rotation"""
-        # Simple rotation animation
-        current = self.logo_label.cget("text")
-        if current == "🚀":
-            self.logo_label.configure(text="✨")
-        else:
-            self.logo_label.configure(text="🚀")
+        # Only redraw while visible; poll slowly when withdrawn or minimized
+        visible = self.winfo_viewable()
+        if visible:
+            current = self.logo_label.cget("text")
+            if current == "🚀":
+                self.logo_label.configure(text="✨")
+            else:
+                self.logo_label.configure(text="🚀")
         
-        self.after(2000, self._animate_logo)
+        self._schedule(2000 if visible else 10000, self._animate_logo)
     
     
     def _toggle_theme(self):
         """Toggle theme with animation"""
         self.current_theme = "light" if self.current_theme == "dark" else "dark"
-        NotificationToast(self, f"Switched to {self.current_theme} theme", "info")
+        theme_manager.set_theme(self.current_theme)
+        self._notify(f"Switched to {self.current_theme} theme", "info")
+    
+    def _on_theme_changed(self):
+        """Re-read the theme after theme_manager switches it"""
+        self._theme = theme_manager.current
+        _font.cache_clear()
     
     def _update_duration(self, value):
-        """Update duration display"""
+        """Update duration display (debounced while the slider is dragged)"""
+        if self._dur_after:
+            self.after_cancel(self._dur_after)
+        self._dur_after = self.after(33, self._apply_duration, value)
+    
+    def _apply_duration(self, value):
+        """Show the selected duration"""
+        self._dur_after = None
         self.duration_value.configure(text=f"{int(value)} min")
     
     
+    def _on_feature_toggle(self, feature_name):
+        """Record the new state of a feature switch"""
+        self.feature_states[feature_name] = bool(self.feature_switches[feature_name].get())
+    
+    def _notify(self, message, toast_type="info"):
+        """Show a message in the shared toast, creating it on first use"""
+        if self._toast is None:
+            self._toast = NotificationToast(self, persistent=True)
+        self._toast.show(message, toast_type)
+    
     def _show_quick_actions(self):
         """Show quick actions menu"""
-        NotificationToast(self, "Quick actions menu", "info")
+        self._notify("Quick actions menu", "info")
     
     def _start_service(self):
         """Start service with animation"""
+        if self._starting:
+            return
+        
+        # Show processing
+        self._starting = True
+        self.processing_indicator.start()
+        self.status_text.configure(text="🔄 Starting...")
+        self.start_btn.configure(state="disabled")
+        
+        # Snapshot the inputs here; widgets must not be read off the Tk thread
+        self._get_page("config")
+        snapshot = {
+            'context': self.context_entry.get("1.0", "end").strip(),
+            'duration_minutes': int(self.duration_slider.get()),
+            'api_key': self.api_key_entry.get()
+        }
+        
+        # Config save and service init are slow; keep the UI pumping
+        threading.Thread(target=self._do_start, args=(snapshot,), daemon=True).start()
+    
+    def _do_start(self, snapshot):
+        """Save config and start the service (worker thread)"""
         try:
-            # Show processing
-            self.processing_indicator.start()
-            self.status_text.configure(text="🔄 Starting...")
-            
-            # Update config
-            self.config.set('context', self.context_entry.get("1.0", "end").strip())
-            self.config.set('duration_minutes', int(self.duration_slider.get()))
-            self.config.set('api_key', self.api_key_entry.get())
-            
-            # Start service
-            self.service_manager = ServiceManager()
-            self.service_manager.config = self.config
-            self.service_manager.start()
-            
-            # Update UI
-            self.start_btn.configure(state="disabled")
-            self.stop_btn.configure(state="normal")
-            self.status_text.configure(text="🟢 Running")
-            
-            # Animate progress
-            self.activity_progress.set_progress(75)
+            self.config.update(snapshot)
             
-            NotificationToast(self, "Service started successfully", "success")
+            manager = ServiceManager()
+            manager.config = self.config
+            manager.start()
             
+            self.after(0, self._on_started, manager)
         except Exception as e:
-            self.status_text.configure(text="🔴 Error")
-            NotificationToast(self, f"Failed to start: {str(e)}", "error")
-        finally:
-            self.processing_indicator.stop()
+            self.after(0, self._on_start_error, str(e))
+    
+    def _on_started(self, manager):
+        """Update widgets once the service is running"""
+        self._starting = False
+        self.service_manager = manager
+        self.processing_indicator.stop()
+        
+        # Update UI
+        self.stop_btn.configure(state="normal")
+        self.status_text.configure(text="🟢 Running")
+        
+        # Animate progress
+        self.activity_progress.set_progress(75)
+        
+        self._notify("Service started successfully", "success")
+    
+    def _on_start_error(self, message):
+        """Report a service start failure"""
+        self._starting = False
+        self.processing_indicator.stop()
+        self.start_btn.configure(state="normal")
+        self.status_text.configure(text="🔴 Error")
+        self._notify(f"Failed to start: {message}", "error")
     
     def _stop_service(self):
         """Stop service"""
@@ -841,19 +992,51 @@ class UltraModernAssistant(ctk.CTk):
                 if hasattr(self, 'processing_indicator'):
                     self.processing_indicator.stop()
                 
-                NotificationToast(self, "Service stopped", "info")
+                self._notify("Service stopped", "info")
         except Exception as e:
             self.logger.error(f"Error stopping service: {e}")
-            NotificationToast(self, f"Error stopping service: {str(e)}", "error")
+            self._notify(f"Error stopping service: {str(e)}", "error")
+    
+    def _schedule(self, ms, callback, *args):
+        """after() wrapper whose pending timer is cancelled on close"""
+        def run():
+            self._after_ids.discard(after_id)
+            callback(*args)
+        
+        after_id = self.after(ms, run)
+        self._after_ids.add(after_id)
+        return after_id
+    
+    def _flush_logs(self):
+        """Move buffered log lines into the viewer in a single insert"""
+        if self._log_buf and self.log_viewer is not None:
+            lines = []
+            while self._log_buf:
+                lines.append(self._log_buf.popleft())
+            
+            self.log_viewer.insert("end", "".join(lines))
+            
+            # Keep the widget as bounded as the buffer
+            line_count = int(self.log_viewer.index("end-1c").split(".")[0])
+            if line_count > self.LOG_MAX_LINES:
+                self.log_viewer.delete("1.0", f"{line_count - self.LOG_MAX_LINES + 1}.0")
+            self.log_viewer.see("end")
+        
+        self._schedule(200, self._flush_logs)
     
     def _start_background_animations(self):
         """Start background animations"""
         # Animate progress bars periodically
         def animate():
-            if self.service_manager and self.service_manager.running:
-                import random
-                self.activity_progress.set_progress(random.randint(60, 90))
-            self.after(3000, animate)
+            # Read the manager once; worker threads may swap it
+            manager = self.service_manager
+            active = manager is not None and getattr(manager, "running", False)
+            if active and self.winfo_viewable():
+                self.activity_progress.set_progress(next(_ACTIVITY_CYCLE))
+                delay = 3000
+            else:
+                delay = 10000
+            self._schedule(delay, animate)
         
         animate()
     
@@ -863,6 +1046,14 @@ class UltraModernAssistant(ctk.CTk):
         self.bind("<Control-s>", lambda e: self._start_service())
         self.bind("<Control-x>", lambda e: self._stop_service())
         self.bind("<F1>", lambda e: self._show_page("about"))
+        
+        # Resume the badge pulse when restored from the tray
+        self.bind("<Map>", self._on_map)
+    
+    def _on_map(self, event):
+        """Restart animations paused while the window was hidden"""
+        if event.widget is self:
+            self.version_badge.start_pulsing()
     
     def _center_window(self):
         """Center window on screen"""
@@ -876,7 +1067,6 @@ class UltraModernAssistant(ctk.CTk):
     def _init_system_tray(self):
         """Initialize system tray"""
         try:
-            from src.gui_components.system_tray import SystemTray
             self.system_tray = SystemTray(self)
             self.system_tray.start()
         except Exception as e:
@@ -895,6 +1085,7 @@ class UltraModernAssistant(ctk.CTk):
             
             if result is True:
                 self.withdraw()
+                self.version_badge.stop_pulsing()
                 if self.system_tray:
                     self.system_tray.show_notification(
                         "Question Assistant",
@@ -902,13 +1093,27 @@ class UltraModernAssistant(ctk.CTk):
                     )
             elif result is False:
                 self._stop_service()
-                if self.system_tray:
-                    self.system_tray.stop()
-                self.quit()
+                self._shutdown()
         else:
-            if self.system_tray:
-                self.system_tray.stop()
-            self.quit()
+            self._shutdown()
+    
+    def _shutdown(self):
+        """Cancel timers and tear the window down"""
+        for after_id in list(self._after_ids):
+            try:
+                self.after_cancel(after_id)
+            except Exception:
+                pass
+        self._after_ids.clear()
+        if self._dur_after:
+            self.after_cancel(self._dur_after)
+        self.version_badge.stop_pulsing()
+        
+        Logger.get_logger().removeHandler(self._log_handler)
+        theme_manager.unsubscribe(self._on_theme_changed)
+        if self.system_tray:
+            self.system_tray.stop()
+        self.destroy()
 
 
 def main():
@@ -6,16 +6,99 @@ from typing import Optional, Callable, Union, Tuple, List
 import math
 import time
 import threading
+from functools import lru_cache
+import numpy as np
 from PIL import Image, ImageDraw, ImageFilter, ImageTk
-import colorsys
 from src.gui_components.themes import theme_manager
+from src.gui_components.color_ops import adjust_brightness, hex_to_rgb, lerp_rgb
 
 
-class GlassmorphicCard(ctk.CTkFrame):
+class AnimationScheduler:
+    """Single frame timer shared by every widget animation"""
+    
+    FRAME_MS = 16  # ~60 FPS
+    
+    def __init__(self):
+        self._callbacks = {}  # insertion-ordered set of frame callbacks
+        self._root = None
+        self._after_id = None
+    
+    def register(self, widget, callback):
+        """Call callback(now) every frame until it returns False"""
+        self._callbacks[callback] = None
+        if self._after_id is None:
+            self._root = widget._root()
+            self._after_id = self._root.after(self.FRAME_MS, self._tick)
+    
+    def unregister(self, callback):
+        """Stop calling callback"""
+        self._callbacks.pop(callback, None)
+    
+    def _tick(self):
+        """Run one frame of every registered animation"""
+        self._after_id = None
+        now = time.monotonic()
+        for callback in list(self._callbacks):
+            if callback not in self._callbacks:
+                continue
+            try:
+                keep = callback(now)
+            except tk.TclError:
+                # Widget was destroyed mid-animation
+                keep = False
+            if not keep:
+                self._callbacks.pop(callback, None)
+        
+        if self._callbacks:
+            try:
+                self._after_id = self._root.after(self.FRAME_MS, self._tick)
+            except tk.TclError:
+                self._callbacks.clear()
+
+
+# Global animation scheduler instance
+animation_scheduler = AnimationScheduler()
+
+# Width of the reference gradient that fills and backgrounds are resized from
+_REF_GRADIENT_WIDTH = 512
+
+
+@lru_cache(maxsize=16)
+def _reference_gradient(start: tuple, end: tuple) -> Image.Image:
+    """One-pixel-high left-to-right gradient, shared per color pair"""
+    ratios = np.arange(_REF_GRADIENT_WIDTH) / _REF_GRADIENT_WIDTH
+    row = lerp_rgb(start, end, ratios)
+    return Image.fromarray(row[None, :, :], "RGB")
+
+
+class _DeferredBorderMixin:
+    """Coalesce rapid border_width changes into one configure per idle pass"""
+    
+    def _init_border(self, width):
+        self._border_width = width
+        self._target_border = width
+        self._border_pending = False
+    
+    def _set_border(self, width):
+        """Request a border width; applied once the event queue is idle"""
+        self._target_border = width
+        if not self._border_pending:
+            self._border_pending = True
+            self.after_idle(self._commit_border)
+    
+    def _commit_border(self):
+        """Apply the latest requested border width if it changed"""
+        self._border_pending = False
+        if self._target_border != self._border_width:
+            self._border_width = self._target_border
+            self.configure(border_width=self._border_width)
+
+
+class GlassmorphicCard(_DeferredBorderMixin, ctk.CTkFrame):
     """Glass-morphic card with blur effect and gradient borders"""
     
     def __init__(self, parent, **kwargs):
-        theme = theme_manager.get_theme()
+        theme = theme_manager.current
         
         super().__init__(
             parent,
@@ -25,6 +108,7 @@ class GlassmorphicCard(ctk.CTkFrame):
             border_color=theme["accent"],
             **kwargs
         )
+        self._init_border(1)
         
         # Add subtle animation on hover
         self.bind("<Enter>", self._on_enter)
@@ -34,10 +118,7 @@ class GlassmorphicCard(ctk.CTkFrame):
         self.overlay = None
         self._create_glass_effect()
     
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex to RGB"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    _hex_to_rgb = staticmethod(hex_to_rgb)
     
     def _create_glass_effect(self):
         """Create glass morphism effect"""
@@ -45,18 +126,18 @@ class GlassmorphicCard(ctk.CTkFrame):
         
     def _on_enter(self, event):
         """Hover enter effect"""
-        self.configure(border_width=2)
+        self._set_border(2)
         
     def _on_leave(self, event):
         """Hover leave effect"""
-        self.configure(border_width=1)
+        self._set_border(1)
 
 
-class NeumorphicButton(ctk.CTkButton):
+class NeumorphicButton(_DeferredBorderMixin, ctk.CTkButton):
     """Neumorphic button with soft shadows and depth"""
     
     def __init__(self, parent, text="", command=None, style="raised", **kwargs):
-        theme = theme_manager.get_theme()
+        theme = theme_manager.current
         
         # Setup colors for neumorphism
         self.bg_color = theme["bg_secondary"]
@@ -74,6 +155,7 @@ class NeumorphicButton(ctk.CTkButton):
             border_width=0,
             **kwargs
         )
+        self._init_border(0)
         
         # Add shadow effects
         self._apply_shadows()
@@ -90,23 +172,16 @@ class NeumorphicButton(ctk.CTkButton):
                 command()
         return wrapper
     
-    def _adjust_brightness(self, hex_color, factor):
-        """Adjust color brightness"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        h, l, s = colorsys.rgb_to_hls(*[x/255.0 for x in rgb])
-        l = max(0, min(1, l * factor))
-        rgb = colorsys.hls_to_rgb(h, l, s)
-        return '#{:02x}{:02x}{:02x}'.format(*[int(x*255) for x in rgb])
+    _adjust_brightness = staticmethod(adjust_brightness)
     
     def _apply_shadows(self):
         """Apply neumorphic shadows"""
         if self.style == "raised":
             # Light shadow on top-left, dark shadow on bottom-right
-            self.configure(border_width=0)
+            self._set_border(0)
         else:
             # Inset style
-            self.configure(border_width=1)
+            self._set_border(1)
     
     def _on_press(self, event):
         """Button press effect"""
@@ -130,7 +205,7 @@ class AnimatedProgressBar(ctk.CTkFrame):
     def __init__(self, parent, width=400, height=8, **kwargs):
         super().__init__(parent, width=width, height=height, **kwargs)
         
-        theme = theme_manager.get_theme()
+        theme = theme_manager.current
         self.theme = theme
         
         # Create canvas for custom drawing
@@ -152,9 +227,31 @@ class AnimatedProgressBar(ctk.CTkFrame):
         # Gradient colors
         self.gradient_start = theme["accent"]
         self.gradient_end = theme["success"]
+        theme_rgb = theme_manager.get_theme_rgb()
+        self._ref_gradient = _reference_gradient(
+            tuple(theme_rgb["accent"]), tuple(theme_rgb["success"])
+        )
         
         self._draw_background()
-        self._animate()
+        
+        # One image item and one glow item, updated in place each frame;
+        # fill images are cached per pixel width
+        self._fill_width = 0
+        self._fill_cache = {}
+        self._fill_id = self.canvas.create_image(
+            0, 0, anchor="nw", state="hidden", tags="progress"
+        )
+        self._glow_id = self.canvas.create_oval(
+            0, 0, 0, 0,
+            fill=self._adjust_brightness(self.gradient_end, 1.3),
+            outline="",
+            state="hidden",
+            tags="progress"
+        )
+        
+        # The animation only runs while progress is catching up to target
+        self._animating = False
+        self._last_frame = 0.0
     
     def _draw_background(self):
         """Draw background track"""
@@ -167,83 +264,66 @@ class AnimatedProgressBar(ctk.CTkFrame):
     def set_progress(self, value: float):
         """Set progress value (0-100)"""
         self.target_progress = max(0, min(100, value))
+        if not self._animating and abs(self.progress - self.target_progress) > 0.1:
+            self._animating = True
+            self._last_frame = time.monotonic()
+            animation_scheduler.register(self, self._animate)
     
-    def _animate(self):
+    def _animate(self, now):
         """Animate progress bar"""
-        if abs(self.progress - self.target_progress) > 0.1:
-            # Smooth animation
-            diff = self.target_progress - self.progress
-            self.progress += diff * self.animation_speed
-            
-            # Redraw progress
-            self._draw_progress()
+        if abs(self.progress - self.target_progress) <= 0.1:
+            self._animating = False
+            return False
+        
+        # Smooth animation, scaled so the speed holds at any frame rate
+        frames = (now - self._last_frame) * 1000 / AnimationScheduler.FRAME_MS
+        self._last_frame = now
+        diff = self.target_progress - self.progress
+        self.progress += diff * (1 - (1 - self.animation_speed) ** frames)
         
-        # Continue animation
-        self.after(16, self._animate)  # ~60 FPS
+        # Redraw progress
+        self._draw_progress()
+        return True
     
     def _draw_progress(self):
         """Draw progress with gradient"""
-        self.canvas.delete("progress")
-        
-        if self.progress > 0:
-            fill_width = int((self.progress / 100) * self.width)
-            
-            # Create gradient effect
-            for i in range(fill_width):
-                ratio = i / max(1, fill_width)
-                color = self._interpolate_color(
-                    self.gradient_start,
-                    self.gradient_end,
-                    ratio
-                )
-                
-                self.canvas.create_line(
-                    i, 0, i, self.height,
-                    fill=color,
-                    tags="progress"
-                )
-            
-            # Add glow effect
-            glow_color = self._adjust_brightness(self.gradient_end, 1.3)
-            self.canvas.create_oval(
-                fill_width - 10, -5,
-                fill_width + 10, self.height + 5,
-                fill=glow_color,
-                outline="",
-                tags="progress"
-            )
+        fill_width = int((self.progress / 100) * self.width)
+        if fill_width == self._fill_width:
+            return
+        self._fill_width = fill_width
+        
+        if fill_width <= 0:
+            self.canvas.itemconfigure("progress", state="hidden")
+            return
+        
+        image = self._fill_cache.get(fill_width)
+        if image is None:
+            image = ImageTk.PhotoImage(self._render_fill(fill_width), master=self.canvas)
+            self._fill_cache[fill_width] = image
+        self.canvas.itemconfigure(self._fill_id, image=image, state="normal")
+        
+        # Add glow effect
+        self.canvas.coords(
+            self._glow_id,
+            fill_width - 10, -5,
+            fill_width + 10, self.height + 5
+        )
+        self.canvas.itemconfigure(self._glow_id, state="normal")
+    
+    def _render_fill(self, fill_width):
+        """Render the gradient stretched across fill_width pixels"""
+        return self._ref_gradient.resize((fill_width, self.height), Image.NEAREST)
+    
+    _hex_to_rgb = staticmethod(hex_to_rgb)
     
-    def _interpolate_color(self, color1, color2, ratio):
-        """Interpolate between two colors"""
-        c1 = self._hex_to_rgb(color1)
-        c2 = self._hex_to_rgb(color2)
-        
-        r = int(c1[0] + (c2[0] - c1[0]) * ratio)
-        g = int(c1[1] + (c2[1] - c1[1]) * ratio)
-        b = int(c1[2] + (c2[2] - c1[2]) * ratio)
-        
-        return f"#{r:02x}{g:02x}{b:02x}"
-    
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex to RGB"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-    
-    def _adjust_brightness(self, hex_color, factor):
-        """Adjust color brightness"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        h, l, s = colorsys.rgb_to_hls(*[x/255.0 for x in rgb])
-        l = max(0, min(1, l * factor))
-        rgb = colorsys.hls_to_rgb(h, l, s)
-        return '#{:02x}{:02x}{:02x}'.format(*[int(x*255) for x in rgb])
+    _adjust_brightness = staticmethod(adjust_brightness)
 
 
 class FloatingActionButton(ctk.CTkButton):
     """Material Design floating action button with ripple effect"""
     
     def __init__(self, parent, icon="➕", command=None, size=56, **kwargs):
-        theme = theme_manager.get_theme()
+        theme = theme_manager.current
         
         super().__init__(
             parent,
@@ -262,31 +342,15 @@ class FloatingActionButton(ctk.CTkButton):
         # Shadow effect
         self.configure(border_width=0)
         
-        # Bind animations
-        self.bind("<Enter>", self._on_enter)
-        self.bind("<Leave>", self._on_leave)
+        # Hover feedback comes from hover_color; clicks animate the corner
+        # radius, which redraws the button without a geometry change
         self.bind("<Button-1>", self._on_click)
         
-        # Store original position for animation
+        # Store original shape for animation
         self.original_size = size
+        self._round_radius = size // 2
     
-    def _adjust_brightness(self, hex_color, factor):
-        """Adjust color brightness"""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        h, l, s = colorsys.rgb_to_hls(*[x/255.0 for x in rgb])
-        l = max(0, min(1, l * factor))
-        rgb = colorsys.hls_to_rgb(h, l, s)
-        return '#{:02x}{:02x}{:02x}'.format(*[int(x*255) for x in rgb])
-    
-    def _on_enter(self, event):
-        """Hover animation"""
-        new_size = int(self.original_size * 1.1)
-        self.configure(width=new_size, height=new_size)
-    
-    def _on_leave(self, event):
-        """Leave animation"""
-        self.configure(width=self.original_size, height=self.original_size)
+    _adjust_brightness = staticmethod(adjust_brightness)
     
     def _on_click(self, event):
         """Ripple effect on click"""
@@ -294,20 +358,20 @@ class FloatingActionButton(ctk.CTkButton):
     
     def _animate_ripple(self):
         """Create ripple animation"""
-        # Scale down then up
-        small_size = int(self.original_size * 0.9)
-        self.configure(width=small_size, height=small_size)
-        self.after(100, lambda: self.configure(
-            width=self.original_size,
-            height=self.original_size
-        ))
+        # Square off briefly then round back
+        self.configure(corner_radius=int(self.original_size * 0.3))
+        self.after(100, self._reset_shape)
+    
+    def _reset_shape(self):
+        """Restore the round shape"""
+        self.configure(corner_radius=self._round_radius)
 
 
 class ModernSwitch(ctk.CTkSwitch):
     """iOS-style animated switch with smooth transitions"""
     
     def __init__(self, parent, text="", command=None, **kwargs):
-        theme = theme_manager.get_theme()
+        theme = theme_manager.current
         
         super().__init__(
             parent,
@@ -329,7 +393,7 @@ class AnimatedSidebar(ctk.CTkFrame):
     """Collapsible sidebar with smooth animations"""
     
     def __init__(self, parent, width=250, **kwargs):
-        theme = theme_manager.get_theme()
+        theme = theme_manager.current
         
         super().__init__(
             parent,
@@ -343,6 +407,11 @@ class AnimatedSidebar(ctk.CTkFrame):
         self.is_collapsed = False
         self.animation_duration = 300  # ms
         self.animation_steps = 20
+        self._step_duration = self.animation_duration // self.animation_steps
+        self._ease = []
+        self._anim_start = 0.0
+        self._anim_width = width
+        self._animating = False
         
         # Prevent frame from shrinking
         self.pack_propagate(False)
@@ -380,23 +449,36 @@ class AnimatedSidebar(ctk.CTkFrame):
     
     def _animate_width(self, start, end):
         """Animate width change"""
-        step_size = (end - start) / self.animation_steps
-        step_duration = self.animation_duration // self.animation_steps
-        
-        def animate_step(current_step):
-            if current_step <= self.animation_steps:
-                new_width = start + (step_size * current_step)
-                self.configure(width=int(new_width))
-                self.after(step_duration, lambda: animate_step(current_step + 1))
-        
-        animate_step(0)
+        # A re-toggle mid-animation reverses from the current width
+        if self._animating:
+            start = self._anim_width
+        
+        self._ease = [
+            int(w) for w in np.linspace(start, end, self.animation_steps + 1)
+        ]
+        self._anim_start = time.monotonic()
+        if not self._animating:
+            self._animating = True
+            animation_scheduler.register(self, self._tick)
+    
+    def _tick(self, now):
+        """Apply the width from the easing table for the elapsed time"""
+        last = len(self._ease) - 1
+        elapsed_ms = (now - self._anim_start) * 1000
+        width = self._ease[min(int(elapsed_ms // self._step_duration), last)]
+        if width != self._anim_width:
+            self._anim_width = width
+            self.configure(width=width)
+        
+        self._animating = width != self._ease[last]
+        return self._animating
 
 
 class PulsingBadge(ctk.CTkLabel):
     """Notification badge with pulsing animation"""
     
     def __init__(self, parent, text="", size=20, **kwargs):
-        theme = theme_manager.get_theme()
+        theme = theme_manager.current
         
         super().__init__(
             parent,
@@ -412,6 +494,9 @@ class PulsingBadge(ctk.CTkLabel):
         
         self.pulsing = False
         self.original_size = size
+        self._pulse_sizes = (size, int(size * 1.2))
+        self._pulse_big = False
+        self._pulse_after = None
     
     def start_pulsing(self):
         """Start pulsing animation"""
@@ -422,34 +507,39 @@ class PulsingBadge(ctk.CTkLabel):
     def stop_pulsing(self):
         """Stop pulsing animation"""
         self.pulsing = False
+        if self._pulse_after is not None:
+            self.after_cancel(self._pulse_after)
+            self._pulse_after = None
+        if self._pulse_big:
+            self._pulse()
     
     def _pulse(self):
         """Pulse animation"""
+        # Alternate between resting and enlarged size every 500 ms
+        self._pulse_big = not self._pulse_big
+        size = self._pulse_sizes[self._pulse_big]
+        self.configure(width=size, height=size)
+        
         if self.pulsing:
-            # Scale up
-            self.configure(
-                width=int(self.original_size * 1.2),
-                height=int(self.original_size * 1.2)
-            )
-            
-            # Scale down after delay
-            self.after(500, lambda: self.configure(
-                width=self.original_size,
-                height=self.original_size
-            ))
-            
-            # Repeat
-            self.after(1000, self._pulse)
+            self._pulse_after = self.after(500, self._pulse)
 
 
 class ModernTooltip:
     """Modern tooltip with fade animation"""
     
+    # Opacity for each 20 ms step of the fade-in
+    _ALPHA_STEPS = tuple(i / 10 for i in range(1, 10))
+    _ALPHA_STEP_MS = 20
+    
     def __init__(self, widget, text, delay=500):
         self.widget = widget
         self.text = text
         self.delay = delay
         self.tooltip = None
+        self._label = None
+        self._visible = False
+        self._alpha_i = 0
+        self._fade_start = 0.0
         self.show_timer = None
         
         # Bind events
@@ -468,24 +558,16 @@ class ModernTooltip:
             self.show_timer = None
         self._hide_tooltip()
     
-    def _show_tooltip(self):
-        """Display tooltip"""
-        if self.tooltip:
-            return
-        
-        theme = theme_manager.get_theme()
+    def _build_tooltip(self):
+        """Create the tooltip window once, hidden until first shown"""
+        theme = theme_manager.current
         
-        # Create tooltip window
         self.tooltip = tk.Toplevel(self.widget)
+        self.tooltip.withdraw()
         self.tooltip.wm_overrideredirect(True)
         
-        # Position near widget
-        x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        self.tooltip.wm_geometry(f"+{x}+{y}")
-        
         # Create tooltip content
-        label = ctk.CTkLabel(
+        self._label = ctk.CTkLabel(
             self.tooltip,
             text=self.text,
             fg_color=theme["bg_tertiary"],
@@ -494,72 +576,124 @@ class ModernTooltip:
             padx=10,
             pady=5
         )
-        label.pack()
+        self._label.pack()
+    
+    def _show_tooltip(self):
+        """Display tooltip"""
+        self.show_timer = None
+        if self._visible:
+            return
+        
+        if self.tooltip is None:
+            self._build_tooltip()
+        elif self._label.cget("text") != self.text:
+            self._label.configure(text=self.text)
+        
+        # Position near widget
+        x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+        self.tooltip.wm_geometry(f"+{x}+{y}")
         
         # Fade in animation
+        self._visible = True
+        self._alpha_i = 0
+        self._fade_start = time.monotonic()
         self.tooltip.attributes("-alpha", 0.0)
-        self._fade_in()
+        self.tooltip.deiconify()
+        animation_scheduler.register(self.tooltip, self._fade_in)
     
     def _hide_tooltip(self):
-        """Hide and destroy tooltip"""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        """Hide tooltip, keeping the window for the next hover"""
+        if self._visible:
+            self._visible = False
+            self.tooltip.withdraw()
     
-    def _fade_in(self):
+    def _fade_in(self, now):
         """Fade in animation"""
-        if self.tooltip:
-            alpha = self.tooltip.attributes("-alpha")
-            if alpha < 0.9:
-                self.tooltip.attributes("-alpha", alpha + 0.1)
-                self.tooltip.after(20, self._fade_in)
+        if not self._visible:
+            return False
+        
+        elapsed_ms = (now - self._fade_start) * 1000
+        i = min(int(elapsed_ms // self._ALPHA_STEP_MS), len(self._ALPHA_STEPS) - 1)
+        if i >= self._alpha_i:
+            self.tooltip.attributes("-alpha", self._ALPHA_STEPS[i])
+            self._alpha_i = i + 1
+        return self._alpha_i < len(self._ALPHA_STEPS)
 
 
 class WaveLoader(ctk.CTkFrame):
     """Wave animation loader"""
     
+    BAR_WIDTH = 8
+    BAR_GAP = 4
+    MAX_HEIGHT = 30
+    
+    # Bar heights for each whole degree of the wave
+    _SIN_LUT = [15 + 15 * math.sin(math.radians(a)) for a in range(360)]
+    
     def __init__(self, parent, num_bars=5, **kwargs):
         super().__init__(parent, **kwargs)
         
-        theme = theme_manager.get_theme()
-        self.bars = []
+        theme = theme_manager.current
+        
+        # All bars live on one canvas so a frame is a single repaint
+        self.canvas = Canvas(
+            self,
+            width=num_bars * (self.BAR_WIDTH + self.BAR_GAP),
+            height=self.MAX_HEIGHT,
+            bg=theme["bg_secondary"],
+            highlightthickness=0
+        )
+        self.canvas.pack()
         
-        # Create animated bars
+        self._bar_ids = []
         for i in range(num_bars):
-            bar = ctk.CTkFrame(
-                self,
-                width=8,
-                height=30,
-                fg_color=theme["accent"],
-                corner_radius=4
+            bar_id = self.canvas.create_rectangle(
+                0, 0, 0, 0,
+                fill=theme["accent"],
+                outline=""
             )
-            bar.grid(row=0, column=i, padx=2)
-            self.bars.append(bar)
+            self._bar_ids.append(bar_id)
         
         self.animating = False
+        self._offset = 0
+        self._wave_start = 0.0
+        self._draw_wave()
     
     def start(self):
         """Start wave animation"""
+        if self.animating:
+            return
         self.animating = True
-        self._animate_wave(0)
+        self._wave_start = time.monotonic()
+        animation_scheduler.register(self, self._animate_wave)
     
     def stop(self):
         """Stop animation"""
         self.animating = False
-    
-    def _animate_wave(self, offset):
+        animation_scheduler.unregister(self._animate_wave)
+    
+    def _draw_wave(self):
+        """Position bars for the current wave offset"""
+        lut = self._SIN_LUT
+        step = self.BAR_WIDTH + self.BAR_GAP
+        for i, bar_id in enumerate(self._bar_ids):
+            height = lut[(self._offset + i * 30) % 360]
+            x = i * step + self.BAR_GAP // 2
+            y = (self.MAX_HEIGHT - height) / 2
+            self.canvas.coords(bar_id, x, y, x + self.BAR_WIDTH, y + height)
+    
+    def _animate_wave(self, now):
         """Animate bars in wave pattern"""
         if not self.animating:
-            return
-        
-        for i, bar in enumerate(self.bars):
-            # Calculate height based on sine wave
-            angle = (offset + i * 30) % 360
-            height = 15 + 15 * math.sin(math.radians(angle))
-            bar.configure(height=int(height))
-        
-        # Continue animation
-        self.after(50, lambda: self._animate_wave(offset + 10))
+            return False
+        
+        # The wave advances 10 degrees every 50 ms
+        offset = int((now - self._wave_start) * 20) * 10 % 360
+        if offset != self._offset:
+            self._offset = offset
+            self._draw_wave()
+        return True
 
 
 class GradientFrame(ctk.CTkFrame):
@@ -569,8 +703,16 @@ class GradientFrame(ctk.CTkFrame):
         super().__init__(parent, **kwargs)
         
         if colors is None:
-            theme = theme_manager.get_theme()
+            theme = theme_manager.current
+            theme_rgb = theme_manager.get_theme_rgb()
             colors = [theme["accent"], theme["success"]]
+            self._ref_gradient = _reference_gradient(
+                tuple(theme_rgb["accent"]), tuple(theme_rgb["success"])
+            )
+        else:
+            self._ref_gradient = _reference_gradient(
+                self._hex_to_rgb(colors[0]), self._hex_to_rgb(colors[1])
+            )
         
         self.colors = colors
         self.gradient_offset = 0
@@ -578,50 +720,65 @@ class GradientFrame(ctk.CTkFrame):
         # Create canvas for gradient
         self.canvas = Canvas(self, highlightthickness=0)
         self.canvas.pack(fill="both", expand=True)
+        self._gradient_id = self.canvas.create_image(0, 0, anchor="nw", tags="gradient")
+        self._gradient_image = None
+        self._gradient_size = (0, 0)
+        self._resize_after = None
+        self.canvas.bind("<Configure>", self._on_configure)
         
         # Start animation
+        self._gradient_after = None
         self._animate_gradient()
     
-    def _create_gradient(self):
+    def _on_configure(self, event):
+        """Rebuild the gradient strip once a resize settles"""
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+            self._resize_after = None
+        if (event.width, event.height) != self._gradient_size:
+            self._resize_after = self.after(
+                50, self._create_gradient, event.width, event.height
+            )
+    
+    def _create_gradient(self, width, height):
         """Create gradient effect"""
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-        
+        self._resize_after = None
         if width <= 1 or height <= 1:
             return
         
-        self.canvas.delete("gradient")
-        
-        # Create gradient lines
-        for i in range(width):
-            ratio = (i + self.gradient_offset) % width / width
-            color = self._interpolate_colors(ratio)
-            
-            self.canvas.create_line(
-                i, 0, i, height,
-                fill=color,
-                tags="gradient"
-            )
-    
-    def _interpolate_colors(self, ratio):
-        """Interpolate between gradient colors"""
-        # Simple two-color interpolation
-        c1 = self._hex_to_rgb(self.colors[0])
-        c2 = self._hex_to_rgb(self.colors[1])
-        
-        r = int(c1[0] + (c2[0] - c1[0]) * ratio)
-        g = int(c1[1] + (c2[1] - c1[1]) * ratio)
-        b = int(c1[2] + (c2[2] - c1[2]) * ratio)
+        # Two copies side by side so scrolling by up to one width wraps seamlessly
+        tile = self._ref_gradient.resize((width, height), Image.NEAREST)
+        strip = Image.new("RGB", (2 * width, height))
+        strip.paste(tile, (0, 0))
+        strip.paste(tile, (width, 0))
         
-        return f"#{r:02x}{g:02x}{b:02x}"
+        self._gradient_image = ImageTk.PhotoImage(strip, master=self.canvas)
+        self._gradient_size = (width, height)
+        self.gradient_offset %= width
+        self.canvas.itemconfigure(self._gradient_id, image=self._gradient_image)
+        self.canvas.coords(self._gradient_id, -self.gradient_offset, 0)
     
-    def _hex_to_rgb(self, hex_color):
-        """Convert hex to RGB"""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    _hex_to_rgb = staticmethod(hex_to_rgb)
     
     def _animate_gradient(self):
         """Animate gradient movement"""
-        self.gradient_offset = (self.gradient_offset + 1) % self.canvas.winfo_width()
-        self._create_gradient()
-        self.after(50, self._animate_gradient)
\ No newline at end of file
+        # The strip only moves a pixel per 50 ms, so it keeps its own timer
+        # rather than waking the shared frame scheduler
+        if not self.winfo_viewable():
+            # Hidden (e.g. withdrawn to the tray); check back slowly
+            self._gradient_after = self.after(1000, self._animate_gradient)
+            return
+        
+        width = self._gradient_size[0]
+        if width:
+            self.gradient_offset = (self.gradient_offset + 1) % width
+            self.canvas.coords(self._gradient_id, -self.gradient_offset, 0)
+        self._gradient_after = self.after(50, self._animate_gradient)
+    
+    def destroy(self):
+        """Stop the gradient animation before destroying the frame"""
+        if self._gradient_after is not None:
+            self.after_cancel(self._gradient_after)
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        super().destroy()
@@ -1,8 +1,9 @@
 """Internationalization and localization support"""
 import json
 import locale
+import sys
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 import gettext
 import logging
 from enum import Enum
@@ -31,10 +32,10 @@ class Translator:
     def __init__(self):
         self.logger = logging.getLogger("Translator")
         self.translations_dir = Path("locales")
-        self.translations_dir.mkdir(exist_ok=True)
         
         # Current language
         self.current_language = Language.ENGLISH
+        self._current_code = self.current_language.value
         
         # Translation cache
         self.translations: Dict[str, Dict[str, str]] = {}
@@ -42,8 +43,15 @@ class Translator:
         # Fallback language
         self.fallback_language = Language.ENGLISH
         
-        # Load all translations
-        self.load_all_translations()
+        # Dicts for the current and fallback languages, bound for get()
+        self._active: Dict[str, str] = {}
+        self._fallback_map: Dict[str, str] = {}
+        
+        # Resolved no-kwargs lookups for the current language
+        self._cache: Dict[str, str] = {}
+        
+        # Only the fallback is preloaded; other languages load on first use
+        self.load_language(self.fallback_language)
         
         # Detect system language
         self.auto_detect_language()
@@ -66,11 +74,32 @@ class Translator:
                 self.logger.error(f"Failed to load {language.value}: {e}")
                 self.translations[language.value] = {}
         else:
-            # Create default translations file
-            self.create_default_translations(language)
+            # Use the built-in defaults without writing them to disk
+            self.translations[language.value] = self._default_translations(language)
+        
+        self._bind_active()
+    
+    def _bind_active(self):
+        """Point the lookup dicts at the current and fallback translations"""
+        self._active = self.translations.get(self._current_code, {})
+        self._fallback_map = self.translations.get(self.fallback_language.value, {})
+        self._cache.clear()
     
     def create_default_translations(self, language: Language):
         """Create default translation file for a language"""
+        translations = self._default_translations(language)
+        
+        # Save translations file
+        self.translations[language.value] = translations
+        self._bind_active()
+        self.translations_dir.mkdir(exist_ok=True)
+        lang_file = self.translations_dir / f"{language.value}.json"
+        
+        with open(lang_file, 'w', encoding='utf-8') as f:
+            json.dump(translations, f, ensure_ascii=False, indent=2)
+    
+    def _default_translations(self, language: Language) -> Dict[str, str]:
+        """Built-in translations for a language"""
         # Default English translations
         if language == Language.ENGLISH:
             translations = {
@@ -286,12 +315,7 @@ class Translator:
             # For other languages, start with empty translations
             translations = {}
         
-        # Save translations file
-        self.translations[language.value] = translations
-        lang_file = self.translations_dir / f"{language.value}.json"
-        
-        with open(lang_file, 'w', encoding='utf-8') as f:
-            json.dump(translations, f, ensure_ascii=False, indent=2)
+        return translations
     
     def auto_detect_language(self):
         """Auto-detect system language"""
@@ -315,38 +339,41 @@ class Translator:
     def set_language(self, language: Language):
         """Set current language"""
         self.current_language = language
+        self._current_code = language.value
         
         # Ensure translations are loaded
         if language.value not in self.translations:
             self.load_language(language)
+        else:
+            self._bind_active()
     
     def get(self, key: str, **kwargs) -> str:
         """Get translated string"""
-        # Try current language
-        if self.current_language.value in self.translations:
-            translation = self.translations[self.current_language.value].get(key)
-            if translation:
-                # Format with kwargs if provided
-                if kwargs:
-                    try:
-                        return translation.format(**kwargs)
-                    except:
-                        pass
+        if not kwargs:
+            translation = self._cache.get(key)
+            if translation is not None:
                 return translation
         
-        # Try fallback language
-        if self.fallback_language.value in self.translations:
-            translation = self.translations[self.fallback_language.value].get(key)
-            if translation:
-                if kwargs:
-                    try:
-                        return translation.format(**kwargs)
-                    except:
-                        pass
+        # Load the current language lazily on a miss
+        if self._current_code not in self.translations:
+            self.load_language(self.current_language)
+        
+        # Try current language, then fallback language
+        translation = self._active.get(key) or self._fallback_map.get(key)
+        
+        if kwargs:
+            if not translation:
+                return key
+            
+            # Format with kwargs
+            try:
+                return translation.format(**kwargs)
+            except:
                 return translation
         
         # Return key if no translation found
-        return key
+        translation = self._cache[key] = sys.intern(translation or key)
+        return translation
     
     def get_available_languages(self) -> List[Tuple[str, str]]:
         """Get list of available languages"""
@@ -382,6 +409,8 @@ class Translator:
         base_strings = self.translations.get(Language.ENGLISH.value, {})
         
         # Get existing translations for target language
+        if language.value not in self.translations:
+            self.load_language(language)
         existing = self.translations.get(language.value, {})
         
         # Create export format
@@ -411,9 +440,12 @@ class Translator:
             if not language:
                 return False
             
-            # Update translations
+            # Merge into the existing translations, loading them if needed
             if language not in self.translations:
-                self.translations[language] = {}
+                try:
+                    self.load_language(Language(language))
+                except ValueError:
+                    self.translations[language] = {}
             
             for item in data.get("translations", []):
                 key = item.get("key")
@@ -421,8 +453,10 @@ class Translator:
                 
                 if key and translation:
                     self.translations[language][key] = translation
+            self._bind_active()
             
             # Save updated translations
+            self.translations_dir.mkdir(exist_ok=True)
             lang_file = self.translations_dir / f"{language}.json"
             with open(lang_file, 'w', encoding='utf-8') as f:
                 json.dump(self.translations[language], f, ensure_ascii=False, indent=2)
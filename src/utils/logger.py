@@ -1,5 +1,7 @@
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -10,6 +12,7 @@ class Logger:
     
     _instance = None
     _logger = None
+    _listener = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -59,8 +62,16 @@ class Logger:
         file_handler.setFormatter(file_formatter)
         console_handler.setFormatter(console_formatter)
         
-        self._logger.addHandler(file_handler)
-        self._logger.addHandler(console_handler)
+        # Callers only enqueue records; a listener thread does the file and
+        # console I/O so GUI and tray threads never block on disk writes
+        log_queue = queue.SimpleQueue()
+        self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
     
     @classmethod
     def get_logger(cls, name: Optional[str] = None) -> logging.Logger:
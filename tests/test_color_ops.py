@@ -0,0 +1,47 @@
+"""Unit tests for the shared color helpers"""
+import unittest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from src.gui_components.color_ops import hex_to_rgb, adjust_brightness, lerp_rgb
+
+
+class TestColorOps(unittest.TestCase):
+    """Test vectorized and cached color helpers"""
+
+    def test_hex_to_rgb(self):
+        """Test hex parsing with and without a leading #"""
+        self.assertEqual(hex_to_rgb("#6366f1"), (0x63, 0x66, 0xf1))
+        self.assertEqual(hex_to_rgb("ffffff"), (255, 255, 255))
+
+    def test_lerp_rgb(self):
+        """Test interpolation endpoints, midpoint and output shape"""
+        result = lerp_rgb((0, 0, 0), (200, 100, 50), np.array([0.0, 0.5, 1.0]))
+
+        self.assertEqual(result.shape, (3, 3))
+        self.assertEqual(result.dtype, np.uint8)
+        self.assertEqual(result.tolist(), [[0, 0, 0], [100, 50, 25], [200, 100, 50]])
+
+    def test_adjust_brightness_limits(self):
+        """Test darkening to black and clamping at white"""
+        self.assertEqual(adjust_brightness("#6366f1", 0), "#000000")
+        self.assertEqual(adjust_brightness("#6366f1", 1000), "#ffffff")
+
+    def test_adjust_brightness_direction(self):
+        """Test brightening raises and darkening lowers every channel"""
+        base = hex_to_rgb("#6366f1")
+        lighter = hex_to_rgb(adjust_brightness("#6366f1", 1.3))
+        darker = hex_to_rgb(adjust_brightness("#6366f1", 0.7))
+
+        for b, l, d in zip(base, lighter, darker):
+            self.assertGreater(l, b)
+            self.assertLess(d, b)
+
+
+if __name__ == '__main__':
+    unittest.main()
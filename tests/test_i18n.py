@@ -0,0 +1,111 @@
+"""Unit tests for the translation system"""
+import unittest
+import tempfile
+import json
+from pathlib import Path
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.localization.i18n import Translator, Language
+
+
+class TestTranslatorLoading(unittest.TestCase):
+    """Test on-demand loading of locale files"""
+
+    def setUp(self):
+        self.translator = Translator()
+        self.translator.translations_dir = Path(tempfile.mkdtemp())
+        self.translator.set_language(Language.ENGLISH)
+
+        # A German locale file on disk that has not been loaded yet
+        self.de_file = self.translator.translations_dir / "de.json"
+        self.de_file.write_text(json.dumps({"a": "A", "b": "B"}), encoding='utf-8')
+        self.translator.translations.pop("de", None)
+
+    def test_only_fallback_preloaded(self):
+        """Test other languages are not loaded until used"""
+        self.assertNotIn("de", self.translator.translations)
+
+        self.translator.set_language(Language.GERMAN)
+        self.assertEqual(self.translator.get("a"), "A")
+
+    def test_import_merges_unloaded_language(self):
+        """Test importing keeps translations already on disk"""
+        import_file = self.translator.translations_dir / "import.json"
+        import_file.write_text(json.dumps({
+            "language": "de",
+            "translations": [{"key": "c", "translation": "C"}]
+        }), encoding='utf-8')
+
+        self.assertTrue(self.translator.import_translations(import_file))
+
+        saved = json.loads(self.de_file.read_text(encoding='utf-8'))
+        self.assertEqual(saved, {"a": "A", "b": "B", "c": "C"})
+
+    def test_export_includes_unloaded_language(self):
+        """Test exporting fills in translations already on disk"""
+        self.translator.translations["en"]["a"] = "English A"
+        output_file = self.translator.translations_dir / "export.json"
+
+        self.translator.export_for_translation(Language.GERMAN, output_file)
+
+        exported = json.loads(output_file.read_text(encoding='utf-8'))
+        by_key = {item["key"]: item["translation"] for item in exported["translations"]}
+        self.assertEqual(by_key["a"], "A")
+
+
+class TestTranslator(unittest.TestCase):
+    """Test translation lookup and cache invalidation"""
+
+    def setUp(self):
+        self.translator = Translator()
+        self.translator.translations_dir = Path(tempfile.mkdtemp())
+        self.translator.set_language(Language.ENGLISH)
+
+    def test_lookup_and_fallback(self):
+        """Test current language, fallback and missing keys"""
+        self.translator.set_language(Language.GERMAN)
+
+        self.assertEqual(self.translator.get("button.start"), "Starten")
+        self.assertEqual(self.translator.get("label.type"), "Question Type")
+        self.assertEqual(self.translator.get("missing.key"), "missing.key")
+
+    def test_set_language_clears_cache(self):
+        """Test cached lookups follow a language change"""
+        self.assertEqual(self.translator.get("button.start"), "Start")
+
+        self.translator.set_language(Language.SPANISH)
+        self.assertEqual(self.translator.get("button.start"), "Iniciar")
+
+        self.translator.set_language(Language.ENGLISH)
+        self.assertEqual(self.translator.get("button.start"), "Start")
+
+    def test_import_translations_clears_cache(self):
+        """Test imported strings replace cached lookups"""
+        self.assertEqual(self.translator.get("button.start"), "Start")
+
+        import_file = self.translator.translations_dir / "import.json"
+        import_file.write_text(json.dumps({
+            "language": "en",
+            "translations": [{"key": "button.start", "translation": "Go"}]
+        }), encoding='utf-8')
+
+        self.assertTrue(self.translator.import_translations(import_file))
+        self.assertEqual(self.translator.get("button.start"), "Go")
+        self.assertTrue((self.translator.translations_dir / "en.json").exists())
+
+    def test_format_kwargs(self):
+        """Test kwargs formatting bypasses the cache"""
+        self.translator.translations["en"]["greeting"] = "Hello {name}"
+        self.translator.set_language(Language.ENGLISH)
+
+        self.assertEqual(self.translator.get("greeting", name="Ana"), "Hello Ana")
+        self.assertEqual(self.translator.get("greeting", name="Bo"), "Hello Bo")
+        self.assertEqual(self.translator.get("greeting"), "Hello {name}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Unit tests for the main window log viewer helpers"""
+import unittest
+import tempfile
+from pathlib import Path
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class TestLogReading(unittest.TestCase):
+    """Test raw log range reading used by the main window log viewer"""
+
+    def setUp(self):
+        # main_window pulls in the service stack, which needs OpenCV
+        from src.gui_components.main_window import EnhancedGUI
+        self.window_cls = EnhancedGUI
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_path = Path(self.temp_dir) / "app.log"
+        self.data = "first line\nsecond ü line\nthird line\n".encode('utf-8')
+        self.log_path.write_bytes(self.data)
+
+    def test_trim_partial_line(self):
+        """Test a leading partial line is dropped except at file start"""
+        trim = self.window_cls._trim_partial_line
+
+        self.assertEqual(trim(0, b"abc\ndef\n"), (0, b"abc\ndef\n"))
+        self.assertEqual(trim(4, b"rst line\nsecond\n"), (13, b"second\n"))
+        self.assertEqual(trim(4, b"no newline"), (4, b"no newline"))
+
+    def test_read_log_range(self):
+        """Test reading whole files, slices and past the end"""
+        read = self.window_cls._read_log_range
+
+        self.assertEqual(read(self.log_path, 0, len(self.data)), self.data)
+        self.assertEqual(read(self.log_path, 6, 10), self.data[6:10])
+        self.assertEqual(read(self.log_path, 0, len(self.data) + 100), self.data)
+        self.assertEqual(read(self.log_path, 5, 5), b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Unit tests for the theme manager"""
+import unittest
+import tempfile
+import json
+from pathlib import Path
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gui_components.themes import ThemeManager, _gradient
+
+
+class TestThemes(unittest.TestCase):
+    """Test theme gradients, caching and custom theme persistence"""
+
+    def setUp(self):
+        # Custom themes are read from and written to config/ under the cwd
+        self.old_cwd = os.getcwd()
+        self.temp_dir = tempfile.mkdtemp()
+        os.chdir(self.temp_dir)
+        self.manager = ThemeManager()
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+
+    def test_get_gradient_uses_current_theme(self):
+        """Test get_gradient spans the theme's gradient endpoints"""
+        theme = self.manager.get_theme()
+        gradient = self.manager.get_gradient(5)
+
+        self.assertEqual(len(gradient), 5)
+        self.assertEqual(gradient[0], theme["gradient_start"].lower())
+        self.assertEqual(gradient[-1], theme["gradient_end"].lower())
+
+    def test_save_custom_theme(self):
+        """Test custom themes are written atomically and reloadable"""
+        theme = {"bg": "#101010", "accent": "#202020"}
+        self.manager.save_custom_theme("mine", theme)
+
+        theme_file = Path("config/custom_themes.json")
+        self.assertTrue(theme_file.exists())
+        self.assertFalse(theme_file.with_suffix('.json.tmp').exists())
+        self.assertEqual(json.loads(theme_file.read_text())["mine"], theme)
+
+        # A fresh manager loads it from disk
+        self.assertEqual(ThemeManager().get_theme("mine"), theme)
+
+    def test_gradient_packing(self):
+        """Test channels are packed into lowercase 6-digit hex strings"""
+        self.assertEqual(_gradient("#000000", "#ffffff", 3), ("#000000", "#7f7f7f", "#ffffff"))
+        self.assertEqual(_gradient("#ff0000", "#0000ff", 2), ("#ff0000", "#0000ff"))
+        self.assertEqual(_gradient("#010203", "#010203", 1), ("#010203",))
+        self.assertEqual(_gradient("#000000", "#ffffff", 0), ())
+
+    def test_theme_rgb_cache_invalidated_on_save(self):
+        """Test saving a custom theme refreshes its parsed RGB colors"""
+        self.manager.save_custom_theme("mine", {"accent": "#102030"})
+        self.assertEqual(self.manager.get_theme_rgb("mine")["accent"].tolist(), [16, 32, 48])
+
+        self.manager.save_custom_theme("mine", {"accent": "#405060"})
+        self.assertEqual(self.manager.get_theme_rgb("mine")["accent"].tolist(), [64, 80, 96])
+
+    def test_set_theme_notifies_subscribers(self):
+        """Test subscribers run only when the current theme changes"""
+        calls = []
+        self.manager.subscribe(lambda: calls.append(self.manager.current["bg"]))
+
+        self.manager.set_theme("dark")
+        self.assertEqual(calls, [])
+
+        self.assertTrue(self.manager.set_theme("light"))
+        self.assertEqual(calls, [self.manager.THEMES["light"]["bg"]])
+
+        self.assertFalse(self.manager.set_theme("missing"))
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()